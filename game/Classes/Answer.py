@@ -3,11 +3,19 @@ class Answer:
     Hold an answer and its corresponding points
     """
 
+    # number of hint levels prepared when the answer is created
+    # (hint level n shows the first n characters)
+    NUM_HINT_LEVELS = 4
+
     def __init__(self, text: str, points: int):
         self.text: str = text.upper()
         self.points: int = points
         self.is_guessed: bool = False
         self.who_guessed: str = ""
+        # hints are only built once, not in every frame
+        self.hints: list[str] = [
+            self._make_hint(n) for n in range(self.NUM_HINT_LEVELS)
+        ]
 
     # call when the answer is guessed
     def guess(self):
@@ -17,3 +25,20 @@ class Answer:
     def reset(self):
         self.is_guessed = False
         self.who_guessed = ""
+
+    # get the hint showing the first hint_length characters,
+    # e.g. "E G G   _ _ _ _ _ _ " for "EGG WAFFLE" with hint_length 3
+    def get_hint(self, hint_length: int) -> str:
+        hint_length = max(0, hint_length)
+        if hint_length < len(self.hints):
+            return self.hints[hint_length]
+        return self._make_hint(hint_length)
+
+    # helper function: build a hint, the other letters are hidden by "_"
+    # (the last letter is never shown)
+    def _make_hint(self, hint_length: int) -> str:
+        shown = min(hint_length, len(self.text) - 1)
+        return "".join(
+            f"{letter} " if not letter.isalnum() or i < shown else "_ "
+            for i, letter in enumerate(self.text)
+        )
@@ -0,0 +1,81 @@
+import os
+from collections import OrderedDict
+
+import pygame
+
+
+class AssetCache:
+    """
+    Hold every image of the game, so that nothing is loaded from disk
+    inside the frame loop (drawing code should only blit)
+    """
+
+    # all images used in the game, loaded once by preload()
+    IMAGE_PATHS = [
+        "Assets/background.png",
+        "Assets/audience1.png",
+        "Assets/audience1_green.png",
+        "Assets/audience1_red.png",
+        "Assets/audience2.png",
+        "Assets/audience2_green.png",
+        "Assets/audience2_red.png",
+    ]
+    # maximum number of resized variants kept in memory
+    MAX_SCALED = 32
+
+    # original images, keyed by normalized path
+    _images: dict[str, pygame.Surface] = {}
+    # resized images, keyed by (path, size), least recently used first
+    _scaled: OrderedDict = OrderedDict()
+
+    # load all images from disk (call after the display is created)
+    # (those already loaded, e.g. for the first frame, are kept)
+    @classmethod
+    def preload(cls):
+        for path in cls.IMAGE_PATHS:
+            if os.path.normpath(path) not in cls._images:
+                cls._load(path)
+
+    # get an image, resized to size if given
+    @classmethod
+    def get_image(
+        cls, path: str, size: tuple[int, int] | None = None
+    ) -> pygame.Surface:
+        path = os.path.normpath(path)
+        image = cls._images.get(path)
+        if image is None:
+            # not preloaded: load it once and keep it
+            image = cls._load(path)
+        if size is None or image.get_size() == tuple(size):
+            return image
+        key = (path, tuple(size))
+        scaled = cls._scaled.get(key)
+        if scaled is not None:
+            cls._scaled.move_to_end(key)  # mark as recently used
+            return scaled
+        scaled = pygame.transform.scale(image, size)
+        cls._scaled[key] = scaled
+        # evict the least recently used variant
+        if len(cls._scaled) > cls.MAX_SCALED:
+            cls._scaled.popitem(last=False)
+        return scaled
+
+    # drop every cached image (e.g. when the display is recreated)
+    @classmethod
+    def clear(cls):
+        cls._images.clear()
+        cls._scaled.clear()
+
+    # helper function: load an image and convert it to the display format
+    @classmethod
+    def _load(cls, path: str) -> pygame.Surface:
+        path = os.path.normpath(path)
+        image = pygame.image.load(path)
+        # pixel format conversion needs a display surface
+        if pygame.display.get_surface() is not None:
+            if image.get_flags() & pygame.SRCALPHA:
+                image = image.convert_alpha()
+            else:
+                image = image.convert()
+        cls._images[path] = image
+        return image
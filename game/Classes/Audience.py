@@ -1,6 +1,7 @@
 import pygame
 import random
 
+from Classes.AssetCache import AssetCache
 from Classes.Constant import Constant
 from Classes.Answer import Answer
 from Classes.Player import Player
@@ -31,10 +32,9 @@ class Audience:
         for member in self.members:
             member.update(dt)
 
-    # draw all the audience members on screen
-    def draw(self, screen: pygame.Surface):
-        for member in self.members:
-            member.draw(screen)
+    # draw all the audience members on screen (return the drawn areas)
+    def draw(self, screen: pygame.Surface) -> list[pygame.Rect]:
+        return [member.draw(screen) for member in self.members]
 
     # update all audience member's position when the screen resizes
     def resize_move(self, old_width, old_height, new_width, new_height):
@@ -61,14 +61,15 @@ class Audience:
                 )  # added some randomness to avoid overlapping
                 member.target.x = target_x + random.randint(-50, 50)
                 if member.state == "left":
-                    member.image = pygame.image.load(
-                        f"Assets/audience{member.image_num}_green.png"
+                    member.image = AssetCache.get_image(
+                        f"Assets/audience{member.image_num}_green.png",
+                        (30, 30),
                     )
                 else:
-                    member.image = pygame.image.load(
-                        f"Assets/audience{member.image_num}_red.png"
+                    member.image = AssetCache.get_image(
+                        f"Assets/audience{member.image_num}_red.png",
+                        (30, 30),
                     )
-                member.image = pygame.transform.scale(member.image, (30, 30))
                 count += 1
             # break the loop when the number of audience member
             # equals the answer's points
@@ -83,10 +84,9 @@ class Audience:
             member.pos = pygame.Vector2(init_x, init_y)
             member.target = pygame.Vector2(init_x, init_y)
             member.state = "neutral"
-            member.image = pygame.image.load(
-                f"Assets/audience{member.image_num}.png"
+            member.image = AssetCache.get_image(
+                f"Assets/audience{member.image_num}.png", (30, 30)
             )
-            member.image = pygame.transform.scale(member.image, (30, 30))
 
     class AudienceMember:
         """
@@ -103,12 +103,12 @@ class Audience:
             self.state = "neutral"
             # load the audience image randomly
             if random.random() >= 0.5:
-                self.image = pygame.image.load("Assets/audience1.png")
                 self.image_num = 1
             else:
-                self.image = pygame.image.load("Assets/audience2.png")
                 self.image_num = 2
-            self.image = pygame.transform.scale(self.image, (30, 30))
+            self.image = AssetCache.get_image(
+                f"Assets/audience{self.image_num}.png", (30, 30)
+            )
 
         # update the position of the audience member (for the animation)
         def update(self, dt):
@@ -124,8 +124,10 @@ class Audience:
                     )  # v.normalize() -> unit vector v
 
         # draw the audience member on screen (with the correct color)
-        def draw(self, screen):
-            screen.blit(self.image, (int(self.pos.x), int(self.pos.y)))
+        def draw(self, screen) -> pygame.Rect:
+            return screen.blit(
+                self.image, (int(self.pos.x), int(self.pos.y))
+            )
 
         # update audience member's position when the screen resizes
         def resize_move(self, old_width, old_height, new_width, new_height):
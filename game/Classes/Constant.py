@@ -1,3 +1,5 @@
+import os
+
 import pygame
 
 
@@ -10,9 +12,27 @@ class Constant:
     SCREEN_WIDTH = 1000
     SCREEN_HEIGHT = 700
     FPS = 60
+    # only push the changed areas of the screen in each frame
+    DIRTY_RECTS = True
+    # use the NumPy audience engine (needed for large crowds)
+    NUMPY_AUDIENCE = False
+    AUDIENCE_SIZE = 100
+    # draw at a fixed resolution (SCREEN_WIDTH x SCREEN_HEIGHT) and scale
+    # the frame to the window, instead of laying out for the window size
+    FIXED_RESOLUTION = False
+    # record every session in SESSION_LOG_DIR, to be re-run by replay.py
+    RECORD_SESSIONS = False
+    SESSION_LOG_DIR = "session_logs"
+    # held backspace: seconds before it repeats, and between repeats
+    KEY_REPEAT_DELAY = 0.4
+    KEY_REPEAT_INTERVAL = 0.05
+    # seconds to wait for new questions before playing the current ones
+    MAX_LOADING_TIME = 3.0
     # Player's Name
     Player_Name = "You"
     AI_Name = "AI"
+    # difficulty preset of the AI player (in Classes/ai_presets.json)
+    AI_DIFFICULTY = "normal"
     # colours
     WHITE = (255, 255, 255)
     BLACK = (0, 0, 0)
@@ -21,5 +41,35 @@ class Constant:
     BLUE = (100, 149, 237)
     GREEN = (0, 200, 0)
     RED = (200, 0, 0)
-    # font
-    FONT_NAME = pygame.font.match_font("arial")
+    # font: the path of arial is searched once (searching the system
+    # fonts is slow), then kept in FONT_CACHE_PATH for the next launches
+    FONT_CACHE_PATH = "font_path.txt"
+    _font_name: str | None = None
+    _font_found = False
+
+    # get the path of the font (None for pygame's default font)
+    @classmethod
+    def get_font_name(cls) -> str | None:
+        if not cls._font_found:
+            cls._font_name = cls._find_font()
+            cls._font_found = True
+        return cls._font_name
+
+    # helper function: the cached path of the font, or search it
+    @classmethod
+    def _find_font(cls) -> str | None:
+        try:
+            with open(cls.FONT_CACHE_PATH, "r", encoding="utf-8") as f:
+                path = f.read().strip()
+            if os.path.exists(path):
+                return path
+        except OSError:
+            pass
+        path = pygame.font.match_font("arial")
+        if path:
+            try:
+                with open(cls.FONT_CACHE_PATH, "w", encoding="utf-8") as f:
+                    f.write(path)
+            except OSError:
+                pass
+        return path
@@ -0,0 +1,124 @@
+import numpy as np
+import pygame
+
+from Classes.AssetCache import AssetCache
+from Classes.Constant import Constant
+from Classes.Answer import Answer
+from Classes.Player import Player
+
+
+class CrowdAudience:
+    """
+    Hold a (large) crowd of audience members in NumPy arrays instead of one
+    object per member, so that the whole crowd moves in one vectorised step
+    and is drawn in one batch (same interface as Audience)
+    """
+
+    # member states
+    NEUTRAL = 0
+    LEFT = 1
+    RIGHT = 2
+
+    def __init__(self, num_members: int = 100, seed: int | None = None):
+        self.num_members = num_members
+        self.rng = np.random.default_rng(seed)
+        self.speed = 300  # animation speed
+        # sprite of each (image_num, state): audience{n}, _green, _red
+        # (kept in an object array, so that it can be indexed by an array)
+        self.sprites = np.empty(6, dtype=object)
+        self.sprites[:] = [
+            AssetCache.get_image(f"Assets/audience{n}{suffix}.png", (30, 30))
+            for n in (1, 2)
+            for suffix in ("", "_green", "_red")
+        ]
+        self.pos = np.zeros((num_members, 2), dtype=np.float32)
+        self.target = np.zeros((num_members, 2), dtype=np.float32)
+        self.state = np.zeros(num_members, dtype=np.int8)
+        # 0 --> audience1.png, 1 --> audience2.png
+        self.image_index = self.rng.integers(0, 2, num_members, dtype=np.int8)
+        self._place_on_stand(0.7)
+
+    # update all audience members' position
+    def update(self, dt: float):
+        direction = self.target - self.pos
+        distance = np.hypot(direction[:, 0], direction[:, 1])
+        moving = distance > 0
+        if not moving.any():
+            return
+        move_distance = self.speed * dt
+        # members that would pass their target stop at the target
+        arrived = moving & (distance <= move_distance)
+        self.pos[arrived] = self.target[arrived]
+        walking = moving & ~arrived
+        self.pos[walking] += (
+            direction[walking]
+            / distance[walking, np.newaxis]
+            * move_distance
+        )
+
+    # draw all the audience members on screen in one batch
+    # (return the area covering the whole crowd)
+    def draw(self, screen: pygame.Surface) -> list[pygame.Rect]:
+        if self.num_members == 0:
+            return []
+        sprite_index = self.image_index * 3 + self.state
+        positions = self.pos.astype(np.int32)
+        batch = zip(
+            self.sprites[sprite_index].tolist(),
+            positions.tolist(),
+        )
+        if hasattr(screen, "fblits"):
+            screen.fblits(batch)
+        else:
+            screen.blits(batch, doreturn=False)
+        left, top = positions.min(axis=0).tolist()
+        right, bottom = positions.max(axis=0).tolist()
+        size = self.sprites[0].get_size()
+        return [
+            pygame.Rect(
+                left, top, right - left + size[0], bottom - top + size[1]
+            )
+        ]
+
+    # update all audience member's position when the screen resizes
+    def resize_move(self, old_width, old_height, new_width, new_height):
+        scale = np.array(
+            [new_width / old_width, new_height / old_height],
+            dtype=np.float32,
+        )
+        # move straight to the new position, the animation continues
+        self.pos *= scale
+        self.target *= scale
+
+    # audience members react to correct answer
+    def react_to_answer(self, answer: Answer, player: Player):
+        # if player guessed the answer
+        if player.name != Constant.Player_Name:
+            # the audience member should go to the left side
+            target_x = Constant.SCREEN_WIDTH * 0.8
+        # else: AI guessed the answer
+        else:
+            target_x = Constant.SCREEN_WIDTH * 0.2
+        state = (
+            self.LEFT if target_x < Constant.SCREEN_WIDTH / 2 else self.RIGHT
+        )
+        # one point moves 1% of the crowd
+        count = round(answer.points * self.num_members / 100)
+        chosen = np.flatnonzero(self.state == self.NEUTRAL)[:count]
+        self.state[chosen] = state
+        # added some randomness to avoid overlapping
+        self.target[chosen, 0] = target_x + self.rng.integers(
+            -50, 51, len(chosen)
+        )
+
+    # reset the positions (and states) of all audience members
+    def reset_positions(self):
+        self._place_on_stand(0.62)
+        self.state[:] = self.NEUTRAL
+
+    # helper function: place every member randomly on the spectator stand
+    def _place_on_stand(self, height_ratio: float):
+        offsets = self.rng.integers(-50, 51, (self.num_members, 2))
+        self.pos[:, 0] = Constant.SCREEN_WIDTH / 2 + offsets[:, 0]
+        self.pos[:, 1] = Constant.SCREEN_HEIGHT * height_ratio + offsets[:, 1]
+        self.target[:] = self.pos
@@ -0,0 +1,56 @@
+import pygame
+
+
+class DirtyRects:
+    """
+    Track what is drawn in each frame, so that only the areas that changed
+    since the last frame are pushed to the display
+    (instead of flipping the whole screen)
+    """
+
+    # push the whole screen if there are more dirty areas than this
+    MAX_RECTS = 48
+
+    def __init__(self):
+        # each element is recorded as (key, rect), where key describes
+        # what is drawn (e.g. text and color) and rect is where it is
+        self.previous: set = set()
+        self.current: set = set()
+        self.full_update = True  # push everything in the next frame
+
+    # call before drawing a frame
+    def begin_frame(self):
+        self.current = set()
+
+    # record an element drawn in this frame
+    def add(self, key, rect: pygame.Rect):
+        self.current.add((key, tuple(rect)))
+
+    # force the whole screen to be pushed in the next frame
+    # (e.g. the window is resized or exposed)
+    def invalidate(self):
+        self.full_update = True
+
+    # call after drawing a frame: return the areas that changed,
+    # or None if the whole screen should be pushed
+    def end_frame(self) -> list[pygame.Rect] | None:
+        # elements that are new, moved or changed, and the areas
+        # of elements that are gone (to be covered by the background)
+        changed = self.current ^ self.previous
+        self.previous = self.current
+        if self.full_update:
+            self.full_update = False
+            return None
+        rects = [pygame.Rect(rect) for _, rect in changed]
+        if len(rects) > self.MAX_RECTS:
+            # too many small areas, push the area covering all of them
+            return [rects[0].unionall(rects[1:])]
+        return rects
+
+    # push the changed areas to the display
+    def update_display(self):
+        rects = self.end_frame()
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
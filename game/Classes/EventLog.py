@@ -0,0 +1,123 @@
+import json
+import struct
+from typing import BinaryIO, Iterator
+
+from Classes.GameState import GameState
+
+
+class EventLog:
+    """
+    Record everything needed to re-run a session of the game logic:
+    the seed of the session's random generator, the questions of each game
+    (and those arriving during a game), the dt of every frame, the guesses,
+    the inputs starting games / rounds and the state changes.
+    The log is binary: a magic header, then records of one byte type,
+    a four bytes payload length and the payload.
+    The records are flushed to the file at every state change and every
+    FLUSH_TICKS frames, so that a crash loses at most a second of them.
+    """
+
+    MAGIC = b"GTAL\x01"
+    # record types
+    SEED = 1  # payload: unsigned 64 bits seed
+    QUESTIONS = 2  # payload: questions in the questions.json format
+    TICK = 3  # payload: dt of the frame (double)
+    GUESS = 4  # payload: player name, "\0", guessed text
+    START_GAME = 5  # no payload
+    NEXT_ROUND = 6  # no payload
+    STATE = 7  # payload: GameState value (one byte)
+    ADD_QUESTIONS = 8  # payload: questions added to the current set
+
+    HEADER = struct.Struct("<BI")
+    SEED_FORMAT = struct.Struct("<Q")
+    TICK_FORMAT = struct.Struct("<d")
+    STATE_FORMAT = struct.Struct("<B")
+    # frames between two flushes
+    FLUSH_TICKS = 60
+
+    def __init__(self, file: BinaryIO):
+        self.file = file
+        self.file.write(self.MAGIC)
+        self.ticks_unflushed = 0
+
+    # create a log file (overwritten if it exists)
+    @classmethod
+    def create(cls, path: str) -> "EventLog":
+        return cls(open(path, "wb"))
+
+    def seed(self, seed: int):
+        self._write(self.SEED, self.SEED_FORMAT.pack(seed))
+
+    def questions(self, question_data: list[dict]):
+        self._write(
+            self.QUESTIONS,
+            json.dumps(question_data, separators=(",", ":")).encode(),
+        )
+
+    def add_questions(self, question_data: list[dict]):
+        self._write(
+            self.ADD_QUESTIONS,
+            json.dumps(question_data, separators=(",", ":")).encode(),
+        )
+
+    def tick(self, dt: float):
+        self._write(self.TICK, self.TICK_FORMAT.pack(dt))
+        self.ticks_unflushed += 1
+        if self.ticks_unflushed >= self.FLUSH_TICKS:
+            self.flush()
+
+    def guess(self, player_name: str, text: str):
+        self._write(self.GUESS, f"{player_name}\0{text}".encode())
+
+    def start_game(self):
+        self._write(self.START_GAME, b"")
+
+    def next_round(self):
+        self._write(self.NEXT_ROUND, b"")
+
+    def state(self, game_state: GameState):
+        self._write(self.STATE, self.STATE_FORMAT.pack(game_state.value))
+        self.flush()
+
+    # write the buffered records to the file
+    def flush(self):
+        self.file.flush()
+        self.ticks_unflushed = 0
+
+    def close(self):
+        self.file.close()
+
+    # read the records of a log file as (type, value) pairs
+    @classmethod
+    def read(cls, path: str) -> Iterator[tuple[int, object]]:
+        with open(path, "rb") as f:
+            if f.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError(f"{path} is not an event log")
+            while header := f.read(cls.HEADER.size):
+                if len(header) < cls.HEADER.size:
+                    return  # the last record was cut (game crashed)
+                record_type, length = cls.HEADER.unpack(header)
+                payload = f.read(length)
+                if len(payload) < length:
+                    return
+                yield record_type, cls._decode(record_type, payload)
+
+    # helper function: append one record
+    def _write(self, record_type: int, payload: bytes):
+        self.file.write(self.HEADER.pack(record_type, len(payload)))
+        self.file.write(payload)
+
+    # helper function: value of a record from its payload
+    @classmethod
+    def _decode(cls, record_type: int, payload: bytes):
+        if record_type == cls.SEED:
+            return cls.SEED_FORMAT.unpack(payload)[0]
+        if record_type in (cls.QUESTIONS, cls.ADD_QUESTIONS):
+            return json.loads(payload)
+        if record_type == cls.TICK:
+            return cls.TICK_FORMAT.unpack(payload)[0]
+        if record_type == cls.GUESS:
+            return tuple(payload.decode().split("\0", 1))
+        if record_type == cls.STATE:
+            return GameState(cls.STATE_FORMAT.unpack(payload)[0])
+        return None
@@ -0,0 +1,90 @@
+import json
+import time
+from collections import deque
+
+
+class FrameTimer:
+    """
+    Measure how long each phase of a frame takes (with a high-resolution
+    timer), keeping the latest samples to compute percentiles and count
+    dropped frames.
+    The latency of each key press, from the start of the frame polling it
+    until that frame is on the display, is kept as the "input" samples.
+    """
+
+    PHASES = ("events", "update", "draw", "display")
+
+    def __init__(self, fps: int, num_samples: int = 600):
+        self.budget = 1 / fps  # time of one frame
+        # samples (in seconds) of each phase, and of the whole frame
+        self.samples: dict[str, deque] = {
+            name: deque(maxlen=num_samples)
+            for name in self.PHASES + ("frame", "input")
+        }
+        self.num_frames = 0
+        # frames that took more than 1.5 frames
+        self.dropped_frames = 0
+        self.frame_start: float | None = None
+        self.lap_start = 0.0
+        # times of the key presses not displayed yet
+        self.key_times: list[float] = []
+
+    # call at the beginning of every frame
+    def begin_frame(self):
+        now = time.perf_counter()
+        if self.frame_start is not None:
+            # time between the start of the last frame and this one
+            frame_time = now - self.frame_start
+            self.samples["frame"].append(frame_time)
+            self.num_frames += 1
+            if frame_time > self.budget * 1.5:
+                self.dropped_frames += 1
+        self.frame_start = now
+        self.lap_start = now
+
+    # call at the end of each phase
+    def lap(self, phase: str):
+        now = time.perf_counter()
+        self.samples[phase].append(now - self.lap_start)
+        self.lap_start = now
+
+    # call when a key press is handled (pygame events carry no arrival time,
+    # so the start of the frame polling them is used)
+    def key_pressed(self):
+        self.key_times.append(self.frame_start)
+
+    # call once the frame is pushed to the display
+    def frame_shown(self):
+        if self.key_times:
+            now = time.perf_counter()
+            for key_time in self.key_times:
+                self.samples["input"].append(now - key_time)
+            self.key_times = []
+
+    # get the statistics of each phase in milliseconds
+    def get_stats(self) -> dict:
+        stats = {}
+        for name, samples in self.samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            stats[name] = {
+                "p50": self._percentile(ordered, 50) * 1000,
+                "p95": self._percentile(ordered, 95) * 1000,
+                "p99": self._percentile(ordered, 99) * 1000,
+                "max": ordered[-1] * 1000,
+            }
+        stats["frames"] = self.num_frames
+        stats["dropped_frames"] = self.dropped_frames
+        return stats
+
+    # write the statistics to a json file
+    def dump(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.get_stats(), f, indent=4)
+
+    # helper function: percentile of sorted samples (nearest rank)
+    @staticmethod
+    def _percentile(ordered: list[float], percent: float) -> float:
+        index = max(0, round(percent / 100 * len(ordered)) - 1)
+        return ordered[index]
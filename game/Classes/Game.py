@@ -2,22 +2,34 @@ import pygame
 import random
 import sys
 import json
-from dotenv import load_dotenv
+import time
 import os
 
+from Classes.Answer import Answer
+from Classes.AssetCache import AssetCache
 from Classes.Constant import Constant
+from Classes.DirtyRects import DirtyRects
+from Classes.EventLog import EventLog
+from Classes.FrameTimer import FrameTimer
 from Classes.GameState import GameState
 from Classes.Question.Question import Question
 from Classes.Player import Player
 from Classes.Audience import Audience
+from Classes.SoundBank import SoundBank
+from Classes.StartupTimer import StartupTimer
+from Classes.TextCache import TextCache
 from Classes.UIComponents import InputBox
-from Classes.Question.GenerateQuestions import GenerateQuestions
-from Classes.Question.GenerateQuestionAudio import GenerateQuestionAudio
+from Classes.Question.QuestionWorker import QuestionWorker
 
 
-# get chatgpt api key
-load_dotenv()
-AZURE_API_KEY = os.getenv("AZURE_API_KEY")
+# get chatgpt api key (read when the questions are first generated,
+# not when the game is imported)
+def get_api_key() -> str | None:
+    # imported here so that dotenv is not loaded before the window opens
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return os.getenv("AZURE_API_KEY")
 
 
 # AIPlayer is defined here because its method depends on
@@ -25,12 +37,53 @@ AZURE_API_KEY = os.getenv("AZURE_API_KEY")
 class AIPlayer(Player):
     """
     Hold information about the AI player, who guesses an answer irregularly.
+    How fast and how well it guesses is set by a difficulty preset,
+    calibrated against simulated players by calibrate.py.
     """
 
-    def __init__(self, name: str = "AI"):
+    PRESETS_PATH = "./Classes/ai_presets.json"
+
+    # first_delay: seconds before the first guess of a round
+    # min_delay, max_delay: range of the random delay between guesses
+    # accuracy: chance of guessing a correct answer
+    def __init__(
+        self,
+        name: str = "AI",
+        first_delay: float = 5.0,
+        min_delay: float = 3.0,
+        max_delay: float = 7.0,
+        accuracy: float = 0.4,
+    ):
         super().__init__(name)
+        self.first_delay = first_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.accuracy = accuracy
         self.decision_timer = 0
-        self.decision_delay = 5  # make initial guess after 5 seconds
+        self.decision_delay = first_delay  # make initial guess
+
+    # create the AI player of a difficulty in the presets file
+    # (the default AI player if there is no presets file or the preset
+    # cannot be loaded)
+    @classmethod
+    def from_preset(
+        cls, difficulty: str, name: str = "AI", path: str = PRESETS_PATH
+    ) -> "AIPlayer":
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                preset = json.load(f)[difficulty]
+            return cls(
+                name,
+                first_delay=preset["first_delay"],
+                min_delay=preset["min_delay"],
+                max_delay=preset["max_delay"],
+                accuracy=preset["accuracy"],
+            )
+        except FileNotFoundError:
+            return cls(name)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Cannot load AI difficulty {difficulty}: {e}")
+            return cls(name)
 
     # update ai player to make decisions with random delay
     def update(self, dt: float, game: "Game"):
@@ -40,8 +93,10 @@ class AIPlayer(Player):
         self.decision_timer += dt
         if self.decision_timer >= self.decision_delay:
             self.decision_timer = 0
-            # random 3-7 seconds delay after each guess
-            self.decision_delay = random.uniform(3, 7)
+            # random delay after each guess
+            self.decision_delay = game.rng.uniform(
+                self.min_delay, self.max_delay
+            )
             self._make_decision(game)
 
     # make the guess
@@ -54,8 +109,9 @@ class AIPlayer(Player):
         if not unguessed:
             # return if no more unguessed answer
             return
-        if random.random() < 0.4:  # 40% of the time make correct guess
-            chosen_answer = random.choice(unguessed)
+        # make correct guess (accuracy of the time)
+        if game.rng.random() < self.accuracy:
+            chosen_answer = game.rng.choice(unguessed)
             game._check_answer(chosen_answer.text, self)
         else:
             # make incorrect guess
@@ -73,9 +129,10 @@ class UIManager:
         self.game = game
 
         # font size
-        self.font_large = pygame.font.Font(Constant.FONT_NAME, 36)
-        self.font_medium = pygame.font.Font(Constant.FONT_NAME, 24)
-        self.font_small = pygame.font.Font(Constant.FONT_NAME, 18)
+        font_name = Constant.get_font_name()
+        self.font_large = pygame.font.Font(font_name, 36)
+        self.font_medium = pygame.font.Font(font_name, 24)
+        self.font_small = pygame.font.Font(font_name, 18)
 
         # input box
         self.input_box_width = 400
@@ -97,14 +154,28 @@ class UIManager:
 
         self.guess_popups = []
 
+        # answer board (answer slots), cached until it changes
+        self.slot_height = 40
+        self.slot_width = 450
+        self.slot_spacing = 8
+        self.board: pygame.Surface | None = None
+        self.board_hint_length = 0
+        self.board_version = 0
+
+        # performance overlay (toggled by F3)
+        self.show_perf_overlay = False
+        self.perf_lines: list[str] = []
+        self.perf_refresh_timer = 0.0
+
+        # areas drawn in each frame (for dirty rectangle rendering)
+        self.dirty_rects = DirtyRects()
+
     # handle keyboard, mouse events
-    def handle_event(self, event: pygame.event.Event | int) -> bool:
+    # (return True if enter is pressed in the input box)
+    def handle_event(self, event: pygame.event.Event) -> bool:
         if self.game.game_state == GameState.RACE_ACTIVE:
-            if event != 0:
-                return self.input_box.handle_event(event)
-            else:
-                self.input_box.handle_hold_backspace()
-        return False  # return false if backspace is pressed
+            return self.input_box.handle_event(event)
+        return False
 
     # udpate messages, popups, input box
     def update(self, dt: float):
@@ -121,12 +192,20 @@ class UIManager:
 
         self.input_box.update(dt)  # update input box
 
+        # refresh the performance overlay twice per second
+        if self.show_perf_overlay:
+            self.perf_refresh_timer -= dt
+            if self.perf_refresh_timer <= 0:
+                self.perf_refresh_timer = 0.5
+                self._refresh_perf_lines()
+
     # draw most UI elements in the game
     def draw(self, screen: pygame.Surface):
+        self.dirty_rects.begin_frame()
         # background
-        background = pygame.image.load("./Assets/background.png")
-        background = pygame.transform.scale(
-            background, (Constant.SCREEN_WIDTH, Constant.SCREEN_HEIGHT)
+        background = AssetCache.get_image(
+            "Assets/background.png",
+            (Constant.SCREEN_WIDTH, Constant.SCREEN_HEIGHT),
         )
         screen.blit(background, (0, 0))
         # draw UI elements according to the gamestate
@@ -154,14 +233,28 @@ class UIManager:
             )
         # draw popups
         for popup in self.guess_popups:
-            popup_surface = self.font_medium.render(
-                popup["text"], True, Constant.WHITE
+            popup_surface = TextCache.render(
+                self.font_medium, popup["text"], Constant.WHITE
             )
             # dim the popup gradually
             alpha = int(255 * (popup["timer"] / popup["duration"]))
             popup_surface.set_alpha(alpha)
             text_rect = popup_surface.get_rect(center=popup["pos"])
             screen.blit(popup_surface, text_rect)
+            self.dirty_rects.add(("popup", popup["text"], alpha), text_rect)
+            # the surface is shared through the cache, restore its alpha
+            popup_surface.set_alpha(None)
+        # draw performance overlay
+        if self.show_perf_overlay:
+            for i, line in enumerate(self.perf_lines):
+                self._draw_text(
+                    screen,
+                    line,
+                    self.font_small,
+                    Constant.WHITE,
+                    10,
+                    35 + i * 20,
+                )
 
     # draw start menu
     def _draw_menu(self, screen: pygame.Surface):
@@ -229,89 +322,24 @@ class UIManager:
         # draw question
         current_q = self.game.get_current_question()
         if current_q:
-            self._draw_text(
+            # long questions are wrapped into multiple lines
+            question_bottom = self._draw_wrapped_text(
                 screen,
                 current_q.text,
                 self.font_medium,
                 Constant.WHITE,
                 Constant.SCREEN_WIDTH // 2,
                 60,
-                center=True,
+                Constant.SCREEN_WIDTH - 80,
             )
-            # draw answer slots
-            start_y = 100
-            slot_height = 40
-            slot_width = 450
-            slot_spacing = 8
-            for i, answer in enumerate(current_q.answers):
-                x_pos = Constant.SCREEN_WIDTH // 2 - slot_width // 2
-                y_pos = start_y + i * (slot_height + slot_spacing)
-                rect = pygame.Rect(x_pos, y_pos, slot_width, slot_height)
-                pygame.draw.rect(screen, Constant.GRAY, rect, 2)
-                # guessed answer: in green if guessed by player,
-                # guessed answer: in red if gussed by ai
-                if answer.is_guessed:
-                    self._draw_text(
-                        screen,
-                        f"{i+1}. {answer.text}",
-                        self.font_medium,
-                        (
-                            Constant.GREEN
-                            if answer.who_guessed == Constant.Player_Name
-                            else Constant.RED
-                        ),
-                        x_pos + 15,
-                        y_pos + slot_height // 2,
-                        center_y=True,
-                    )
-                    self._draw_text(
-                        screen,
-                        str(answer.points),
-                        self.font_medium,
-                        (
-                            Constant.GREEN
-                            if answer.who_guessed == Constant.Player_Name
-                            else Constant.RED
-                        ),
-                        x_pos + slot_width - 15,
-                        y_pos + slot_height // 2,
-                        center_y=True,
-                        align_right=True,
-                    )
-                # unguessed answer
-                else:
-                    # hint first few characters (+1 for every 20 seconds)
-                    hint_length = 3 - int(self.game.round_time_remaining) // 20
-                    text = "".join(
-                        [
-                            (
-                                f"{letter} "
-                                if not letter.isalnum()
-                                else (
-                                    f"{letter} "
-                                    if (
-                                        i
-                                        < min(
-                                            hint_length, len(answer.text) - 1
-                                        )
-                                    )
-                                    else "_ "
-                                )
-                            )
-                            for i, letter in enumerate(answer.text)
-                        ]
-                    )
-                    if self.game.game_state == GameState.RACE_END:
-                        text = answer.text
-                    self._draw_text(
-                        screen,
-                        f"{i+1}. {text}",
-                        self.font_medium,
-                        Constant.GRAY,
-                        x_pos + 15,
-                        y_pos + slot_height // 2,
-                        center_y=True,
-                    )
+            # draw answer slots (drawn again only when the board changes)
+            board = self._get_board(current_q)
+            board_rect = board.get_rect(
+                centerx=Constant.SCREEN_WIDTH // 2,
+                top=max(100, question_bottom + 10),
+            )
+            screen.blit(board, board_rect)
+            self.dirty_rects.add(("board", self.board_version), board_rect)
 
         # draw progress bar (display {player's round score}:{ai's round score})
         bar_width = Constant.SCREEN_WIDTH // 2.5
@@ -327,6 +355,9 @@ class UIManager:
         else:
             player_ratio = 0.5
         player_bar_width = int(bar_width * player_ratio)
+        self.dirty_rects.add(
+            ("bar", player_bar_width), (bar_x, bar_y, bar_width, bar_height)
+        )
         # player's side in green
         pygame.draw.rect(
             screen,
@@ -360,6 +391,15 @@ class UIManager:
         # draw input box and prompts
         if self.game.game_state == GameState.RACE_ACTIVE:
             self.input_box.draw(screen)
+            self.dirty_rects.add(
+                (
+                    "input",
+                    self.input_box.text,
+                    self.input_box.color,
+                    self.input_box.active and self.input_box.cursor_visible,
+                ),
+                self.input_box.rect,
+            )
             prompt_y = self.input_box.rect.y - 25
             self._draw_text(
                 screen,
@@ -390,6 +430,85 @@ class UIManager:
                 center=True,
             )
 
+    # helper function: get the answer board, drawn again only if it is
+    # invalidated or the hint level changed
+    def _get_board(self, question: Question) -> pygame.Surface:
+        # hint first few characters (+1 for every 20 seconds)
+        hint_length = 3 - int(self.game.round_time_remaining) // 20
+        if self.board is None or hint_length != self.board_hint_length:
+            self.board = self._draw_board(question, hint_length)
+            self.board_hint_length = hint_length
+            self.board_version += 1
+        return self.board
+
+    # helper function: draw all answer slots on a new surface
+    def _draw_board(
+        self, question: Question, hint_length: int
+    ) -> pygame.Surface:
+        slot_height = self.slot_height
+        slot_width = self.slot_width
+        board = pygame.Surface(
+            (
+                slot_width,
+                len(question.answers) * (slot_height + self.slot_spacing),
+            ),
+            pygame.SRCALPHA,
+        )
+        for i, answer in enumerate(question.answers):
+            y_pos = i * (slot_height + self.slot_spacing)
+            rect = pygame.Rect(0, y_pos, slot_width, slot_height)
+            pygame.draw.rect(board, Constant.GRAY, rect, 2)
+            # guessed answer: in green if guessed by player,
+            # guessed answer: in red if gussed by ai
+            if answer.is_guessed:
+                color = (
+                    Constant.GREEN
+                    if answer.who_guessed == Constant.Player_Name
+                    else Constant.RED
+                )
+                self._draw_text(
+                    board,
+                    f"{i+1}. {answer.text}",
+                    self.font_medium,
+                    color,
+                    15,
+                    y_pos + slot_height // 2,
+                    center_y=True,
+                    track=False,
+                )
+                self._draw_text(
+                    board,
+                    str(answer.points),
+                    self.font_medium,
+                    color,
+                    slot_width - 15,
+                    y_pos + slot_height // 2,
+                    center_y=True,
+                    align_right=True,
+                    track=False,
+                )
+            # unguessed answer
+            else:
+                text = answer.get_hint(hint_length)
+                if self.game.game_state == GameState.RACE_END:
+                    text = answer.text
+                self._draw_text(
+                    board,
+                    f"{i+1}. {text}",
+                    self.font_medium,
+                    Constant.GRAY,
+                    15,
+                    y_pos + slot_height // 2,
+                    center_y=True,
+                    track=False,
+                )
+        return board
+
+    # draw the answer board again in the next frame
+    # (call when an answer is guessed or the game state changes)
+    def invalidate_board(self):
+        self.board = None
+
     # draw game over screen
     def _draw_game_over(self, screen: pygame.Surface):
         self._draw_text(
@@ -486,8 +605,9 @@ class UIManager:
         center=False,
         center_y=False,
         align_right=False,
+        track=True,
     ):
-        text_surface = font.render(text, True, color)
+        text_surface = TextCache.render(font, text, color)
         text_rect = text_surface.get_rect()
         if center:
             text_rect.centerx = x
@@ -500,6 +620,47 @@ class UIManager:
         else:
             text_rect.top = y
         surface.blit(text_surface, text_rect)
+        # track: record the drawn area (False if not drawn on the screen)
+        if track:
+            self.dirty_rects.add(("text", font, text, color), text_rect)
+
+    # helper function: draw text horizontally centered at x, wrapped to
+    # max_width, starting at y (return the bottom of the last line)
+    def _draw_wrapped_text(
+        self, surface, text, font, color, x, y, max_width
+    ) -> int:
+        lines = TextCache.wrap(font, text, max_width)
+        line_height = font.get_linesize()
+        for i, line in enumerate(lines):
+            self._draw_text(
+                surface,
+                line,
+                font,
+                color,
+                x,
+                y + i * line_height,
+                center=True,
+            )
+        return y + line_height * len(lines)
+
+    # show / hide the performance overlay
+    def toggle_perf_overlay(self):
+        self.show_perf_overlay = not self.show_perf_overlay
+        self.perf_refresh_timer = 0
+
+    # helper function: format the frame timing statistics
+    def _refresh_perf_lines(self):
+        stats = self.game.frame_timer.get_stats()
+        self.perf_lines = [
+            f"{name}: p50 {stats[name]['p50']:.1f} / "
+            f"p95 {stats[name]['p95']:.1f} / "
+            f"p99 {stats[name]['p99']:.1f} ms"
+            for name in FrameTimer.PHASES + ("frame", "input")
+            if name in stats
+        ]
+        self.perf_lines.append(
+            f"dropped: {stats['dropped_frames']} / {stats['frames']} frames"
+        )
 
     # add messages to be shown on screen
     def show_message(self, text: str, duration: float = 2.0):
@@ -528,17 +689,76 @@ class Game:
     Holding game logic and running game cycle.
     """
 
+    # events handled by the game, the others are not queued
+    # (TEXTINPUT carries the typed text of the KEYDOWN events)
+    EVENT_TYPES = [
+        pygame.QUIT,
+        pygame.KEYDOWN,
+        pygame.KEYUP,
+        pygame.TEXTINPUT,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.VIDEORESIZE,
+        pygame.WINDOWEXPOSED,
+    ]
+
     # initialize everything
-    def __init__(self):
-        # initialize meta-stuffs
-        pygame.init()
-        pygame.font.init()
-        self.screen: pygame.Surface = pygame.display.set_mode(
-            (Constant.SCREEN_WIDTH, Constant.SCREEN_HEIGHT), pygame.RESIZABLE
-        )
-        pygame.display.set_caption("Guess Their Answer")
-        self.clock: pygame.time.Clock = pygame.time.Clock()
-        self.frame = 0
+    # headless: run the game logic only, without display, audio and UI
+    # question_data: questions (in the questions.json format) to be used
+    #                instead of the questions.json
+    # seed: seed of the random generator of the session (random if None)
+    # event_log: record the session in this log (see Classes/EventLog.py)
+    # startup_timer: timer started before the imports (by main.py)
+    def __init__(
+        self,
+        headless: bool = False,
+        question_data: list[dict] | None = None,
+        seed: int | None = None,
+        event_log: EventLog | None = None,
+        startup_timer: StartupTimer | None = None,
+    ):
+        self.headless = headless
+        self.startup_timer = startup_timer or StartupTimer()
+        # every random decision of the game logic comes from this
+        # generator, so that a session can be replayed from its seed
+        # (the audience animation uses its own, it does not affect the game)
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self.rng = random.Random(self.seed)
+        if event_log is None and not headless and Constant.RECORD_SESSIONS:
+            os.makedirs(Constant.SESSION_LOG_DIR, exist_ok=True)
+            event_log = EventLog.create(
+                os.path.join(
+                    Constant.SESSION_LOG_DIR,
+                    time.strftime("session_%Y%m%d_%H%M%S.log"),
+                )
+            )
+        self.event_log = event_log
+        if self.event_log:
+            self.event_log.seed(self.seed)
+        if not headless:
+            # initialize meta-stuffs
+            pygame.init()
+            pygame.font.init()
+            # window: the display surface
+            # screen: the surface everything is drawn on, which is the
+            #         window, or an off-screen surface in FIXED_RESOLUTION
+            #         mode when the window size differs
+            self.window: pygame.Surface = pygame.display.set_mode(
+                (Constant.SCREEN_WIDTH, Constant.SCREEN_HEIGHT),
+                pygame.RESIZABLE,
+            )
+            self.screen: pygame.Surface = self.window
+            # area of the window showing the screen
+            self.viewport: pygame.Rect = self.window.get_rect()
+            pygame.display.set_caption("Guess Their Answer")
+            # only queue the events the game handles (e.g. not the mouse
+            # motion), so that key presses never wait behind other events
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(self.EVENT_TYPES)
+            self.clock: pygame.time.Clock = pygame.time.Clock()
+            # time spent in each phase of the frames
+            self.frame_timer = FrameTimer(Constant.FPS)
+            self.startup_timer.mark("window")
+            # (images and sounds are loaded once the menu is shown)
         self.running: bool = True
         self.game_state: GameState = GameState.LOADING
         # initialize game variables
@@ -548,39 +768,127 @@ class Game:
         self.max_rounds: int = 3
         self.round_time_total = 60
         self.round_time_remaining = self.round_time_total
+        self.loading_time = 0.0  # seconds waited for new questions
         # initialize classes, elements in the game
-        self._load_questions("./Classes/Question/questions.json")
+        if question_data is None:
+            self._load_questions("./Classes/Question/questions.json")
+        else:
+            self.questions = [Question(q_data) for q_data in question_data]
         self.player1: Player = Player(name="You")
-        self.ai_player: AIPlayer = AIPlayer(name="AI")
-        self.audience: Audience = Audience()
-        self.ui_manager: UIManager = UIManager(self)
+        self.ai_player: AIPlayer = AIPlayer.from_preset(
+            Constant.AI_DIFFICULTY, name="AI"
+        )
+        # (no audience, UI and question generation in headless mode)
+        self.audience = None
+        self.ui_manager = None
+        self.question_worker = None
+        if not headless:
+            # (the audience is created once the menu is shown)
+            self.ui_manager: UIManager = UIManager(self)
+            self.startup_timer.mark("game setup")
         self.change_state(GameState.MENU)
 
     # run the game
     def run(self):
+        # show the menu first, then load what the menu does not need
+        self._draw()
+        self._update_display()
+        pygame.event.pump()
+        self.startup_timer.mark("first frame")
+        menu_time = self.startup_timer.elapsed()
+        self._finish_startup()
+        print(self.startup_timer.report())
+        print(f"Menu shown after {menu_time * 1000:.0f} ms")
         while self.running:
             dt = self.clock.tick(Constant.FPS) / 1000.0
+            self.frame_timer.begin_frame()
             self._handle_events()
+            self.frame_timer.lap("events")
             self._update(dt)
+            self.frame_timer.lap("update")
             self._draw()
-            pygame.display.flip()
+            self.frame_timer.lap("draw")
+            self._update_display()
+            self.frame_timer.lap("display")
+            self.frame_timer.frame_shown()
+        # keep the frame timing for investigating stutters
+        self.frame_timer.dump("perf_stats.json")
+        if self.event_log:
+            self.event_log.close()
         pygame.quit()
         sys.exit()
 
+    # load what is not needed by the first frame of the menu
+    def _finish_startup(self):
+        # load every image once, after the display is created
+        AssetCache.preload()
+        # decode every sound once
+        SoundBank.preload()
+        self.startup_timer.mark("images and sounds")
+        # create the audience (its images are preloaded above)
+        if Constant.NUMPY_AUDIENCE:
+            # imported here so that numpy is only needed by this engine
+            from Classes.CrowdAudience import CrowdAudience
+
+            self.audience = CrowdAudience(Constant.AUDIENCE_SIZE)
+        else:
+            self.audience: Audience = Audience()
+        self.startup_timer.mark("audience")
+        # generate new questions in background while the menu is shown
+        self.question_worker = QuestionWorker(get_api_key())
+        self.question_worker.start()
+        self.startup_timer.mark("question worker")
+
+    # run a whole game in headless mode: time advances by a fixed
+    # timestep dt as fast as possible, instead of in real time
+    # guesses: {round number: [(seconds into the round, guessed text)]}
+    # (return the game scores of the player and the AI)
+    def simulate_game(
+        self,
+        guesses: dict[int, list[tuple[float, str]]],
+        dt: float = 1 / Constant.FPS,
+    ) -> tuple[int, int]:
+        self._start_new_game()
+        while self.game_state != GameState.GAME_OVER:
+            script = sorted(guesses.get(self.round_number, []))
+            next_guess = 0
+            elapsed = 0.0
+            while self.game_state == GameState.RACE_ACTIVE:
+                # submit the guesses that are due
+                while (
+                    next_guess < len(script)
+                    and script[next_guess][0] <= elapsed
+                ):
+                    self._check_answer(script[next_guess][1], self.player1)
+                    next_guess += 1
+                self._update(dt)
+                elapsed += dt
+            self._next_round_or_end_game()
+        return self.player1.game_score, self.ai_player.game_score
+
     # handle all mouse, keyboard events in the game
     def _handle_events(self):
         # quit game in quit event
         for event in pygame.event.get():
+            if self.screen is not self.window:
+                event = self._to_screen_event(event)
+            # measure how long until the key press is on the display
+            if event.type == pygame.KEYDOWN:
+                self.frame_timer.key_pressed()
             if event.type == pygame.QUIT:
                 self.running = False
                 self.change_state(GameState.QUITTING)
                 return
+            # show / hide performance overlay when pressing F3
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.ui_manager.toggle_perf_overlay()
+                continue
             # in start menu
             if self.game_state == GameState.MENU:
                 if event.type == pygame.KEYDOWN:
                     # start game when pressing SPACE
                     if event.key == pygame.K_SPACE:
-                        self._start_new_game()
+                        self._request_new_game()
                     # quit game when pressing ESC
                     elif event.key == pygame.K_ESCAPE:
                         self.running = False
@@ -604,15 +912,14 @@ class Game:
                     event.type == pygame.KEYDOWN
                     and event.key == pygame.K_SPACE
                 ):
-                    if self.round_number >= self.max_rounds:
-                        self._end_game()
+                    if self._is_next_question_pending():
+                        self._show_message("Loading next question...", 1.5)
                     else:
-                        self._start_new_round()
+                        self._next_round_or_end_game()
             # game over
             elif self.game_state == GameState.GAME_OVER:
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
-                        self._generate_new_questions()
                         self.change_state(GameState.MENU)
                         self.player1.reset_game_score()
                         self.ai_player.reset_game_score()
@@ -620,8 +927,16 @@ class Game:
                         self.running = False
                         self.change_state(GameState.QUITTING)
 
+            # the window content is lost, push the whole screen again
+            if event.type == pygame.WINDOWEXPOSED:
+                self.ui_manager.dirty_rects.invalidate()
+
             # user is resizing window
-            if event.type == pygame.VIDEORESIZE:
+            if event.type == pygame.VIDEORESIZE and Constant.FIXED_RESOLUTION:
+                # layout and game state stay the same, only the final
+                # scaling of the frame changes
+                self._resize_window(event.w, event.h)
+            elif event.type == pygame.VIDEORESIZE:
                 old_width = Constant.SCREEN_WIDTH
                 old_height = Constant.SCREEN_HEIGHT
                 Constant.SCREEN_WIDTH = max(event.w, 600)
@@ -633,35 +948,59 @@ class Game:
                     Constant.SCREEN_WIDTH,
                     Constant.SCREEN_HEIGHT,
                 )
-                self.screen: pygame.Surface = pygame.display.set_mode(
+                self.window = pygame.display.set_mode(
                     (Constant.SCREEN_WIDTH, Constant.SCREEN_HEIGHT),
                     pygame.RESIZABLE,
                 )
-
-        # additional event handler for holding backspace
-        if pygame.key.get_pressed()[pygame.K_BACKSPACE]:
-            self.frame += 1
-            # send a backspace event every 10 frames to UIManager
-            # i.e., delete last character in the input box every 10 frames
-            if self.frame >= 10:
-                self.frame = 0
-                self.ui_manager.handle_event(0)
-        else:
-            self.frame = 0
+                self.screen = self.window
+                self.viewport = self.window.get_rect()
+                self.ui_manager.dirty_rects.invalidate()
 
     # update everything per dt
     def _update(self, dt: float):
-        self.ui_manager.update(dt)  # update UIManager
+        if self.event_log:
+            self.event_log.tick(dt)
+        if not self.headless:
+            self.ui_manager.update(dt)  # update UIManager
+            SoundBank.update()  # start the sounds decoded meanwhile
         # if during race
         if self.game_state == GameState.RACE_ACTIVE:
             self.round_time_remaining -= dt  # update clock
             if self.round_time_remaining <= 0:
                 self._end_round()
             self.ai_player.update(dt, self)  # update AIPlayer
-            self.audience.update(dt)  # update audience
-        # when race ended
-        if self.game_state == GameState.RACE_END:
-            self.audience.update(dt)  # update audience
+        # update audience if race is active or just ended
+        if not self.headless and (
+            self.game_state == GameState.RACE_ACTIVE
+            or self.game_state == GameState.RACE_END
+        ):
+            self.audience.update(dt)
+        # questions of the current set arriving while it is played
+        # (after the game logic of the frame, in the order a replay adds
+        # them: after the frame's update)
+        if self.question_worker:
+            more_questions = self.question_worker.adopt_more()
+            if more_questions:
+                self._add_questions(more_questions)
+                SoundBank.load_voice_lines(self.question_worker.audio_paths)
+        # start the game once the new questions are generated (or failed)
+        # (last, so that a game started here is updated from the next
+        # frame on, like in a replay; never in headless mode, there is no
+        # question generation)
+        if self.game_state == GameState.LOADING and self.question_worker:
+            self.loading_time += dt
+            if (
+                self.question_worker.is_ready()
+                or not self.question_worker.is_busy()
+            ):
+                self._request_new_game()
+            # do not keep the player waiting for the network when there
+            # are questions to play already
+            elif (
+                self.loading_time >= Constant.MAX_LOADING_TIME
+                and self.questions
+            ):
+                self._start_new_game()
 
     # draw everything on screen
     def _draw(self):
@@ -670,9 +1009,68 @@ class Game:
             self.game_state == GameState.RACE_ACTIVE
             or self.game_state == GameState.RACE_END
         ):
-            self.audience.draw(
-                self.screen
-            )  # draw audience if race is active or just ended
+            # draw audience if race is active or just ended
+            rects = self.audience.draw(self.screen)
+            for i, rect in enumerate(rects):
+                self.ui_manager.dirty_rects.add(("audience", i), rect)
+
+    # push the drawn frame to the window
+    def _update_display(self):
+        if self.screen is not self.window:
+            # nothing changed since the last frame
+            if Constant.DIRTY_RECTS:
+                if self.ui_manager.dirty_rects.end_frame() == []:
+                    return
+            # scale the whole frame to the window once
+            pygame.transform.smoothscale(
+                self.screen,
+                self.viewport.size,
+                self.window.subsurface(self.viewport),
+            )
+            pygame.display.flip()
+        elif Constant.DIRTY_RECTS:
+            # only push the areas changed since the last frame
+            self.ui_manager.dirty_rects.update_display()
+        else:
+            pygame.display.flip()
+
+    # helper function: recreate the window in FIXED_RESOLUTION mode
+    def _resize_window(self, width: int, height: int):
+        self.window = pygame.display.set_mode(
+            (width, height), pygame.RESIZABLE
+        )
+        size = (Constant.SCREEN_WIDTH, Constant.SCREEN_HEIGHT)
+        if self.window.get_size() == size:
+            # draw on the window directly
+            self.screen = self.window
+            self.viewport = self.window.get_rect()
+        else:
+            if self.screen.get_size() != size or self.screen is self.window:
+                self.screen = pygame.Surface(size).convert()
+            # keep the aspect ratio, with black borders
+            self.viewport = self.screen.get_rect().fit(
+                self.window.get_rect()
+            )
+            self.window.fill(Constant.BLACK)
+        self.ui_manager.dirty_rects.invalidate()
+
+    # helper function: convert the mouse position of an event from window
+    # to screen coordinates (FIXED_RESOLUTION mode)
+    def _to_screen_event(self, event: pygame.event.Event):
+        if event.type not in (
+            pygame.MOUSEBUTTONDOWN,
+            pygame.MOUSEBUTTONUP,
+            pygame.MOUSEMOTION,
+        ):
+            return event
+        x = (event.pos[0] - self.viewport.x) * (
+            self.screen.get_width() / self.viewport.width
+        )
+        y = (event.pos[1] - self.viewport.y) * (
+            self.screen.get_height() / self.viewport.height
+        )
+        attributes = dict(event.dict, pos=(int(x), int(y)))
+        return pygame.event.Event(event.type, attributes)
 
     # load questions from json
     def _load_questions(self, filepath: str):
@@ -685,8 +1083,25 @@ class Game:
         except Exception as e:
             print(f"An error occurred when loading questions: {e}")
 
+    # start new game with the newly generated questions if there are,
+    # show the loading screen if they are still being generated
+    # (the current questions if there is no question worker)
+    def _request_new_game(self):
+        if (
+            self.question_worker is None
+            or self._adopt_new_questions()
+            or not self.question_worker.is_busy()
+        ):
+            self._start_new_game()
+        else:
+            self.loading_time = 0.0
+            self.change_state(GameState.LOADING)
+
     # start new game if current game ended
     def _start_new_game(self):
+        if self.event_log:
+            self.event_log.questions([q.to_data() for q in self.questions])
+            self.event_log.start_game()
         # reset scores
         self.player1.reset_game_score()
         self.ai_player.reset_game_score()
@@ -695,6 +1110,9 @@ class Game:
         self.current_question_index = -1
         for q in self.questions:
             q.reset()
+        # generate the questions of the next game while playing
+        if self.question_worker:
+            self.question_worker.start()
         # start new round
         self._start_new_round()
 
@@ -713,44 +1131,48 @@ class Game:
         current_q = self.get_current_question()
         if current_q:
             current_q.reset()
-        # reset audience
-        self.audience.reset_positions()
-        # reset input box
-        self.ui_manager.input_box.clear()
+        if not self.headless:
+            # reset audience
+            self.audience.reset_positions()
+            # reset input box
+            self.ui_manager.input_box.clear()
         # reset timer
         self.round_time_remaining = self.round_time_total
         self.ai_player.decision_timer = 0
+        self.ai_player.decision_delay = self.ai_player.first_delay
         # update game state
         self.change_state(GameState.RACE_ACTIVE)
         # show start round message
-        self.ui_manager.show_message(f"Round {self.round_number} Start!", 2.0)
+        self._show_message(f"Round {self.round_number} Start!", 2.0)
         # play the audio of bot reading the current question
-        q_recording = pygame.mixer.Sound(f"Assets/Q{self.round_number}.mp3")
-        q_recording.play()
+        SoundBank.play_voice_line(self.round_number)
         # play background music
-        pygame.mixer.music.load("Assets/background.mp3")
-        pygame.mixer.music.play(loops=-1)
+        SoundBank.play_music()
 
     # end current round
     def _end_round(self):
         self.change_state(GameState.RACE_END)  # change gamestate
-        pygame.mixer.music.stop()  # stop bgm
+        SoundBank.stop_music()  # stop bgm and any pending voice line
         # play ending sound effect
-        end_sound = pygame.mixer.Sound(f"Assets/cymbal.mp3")
-        end_sound.play()
+        SoundBank.play_effect("cymbal")
+        # decode the question of the next round while the results are shown
+        SoundBank.prepare_voice_line(self.round_number + 1)
 
     # check guessed answer
-    def _check_answer(self, submitted_text: str, player: Player):
+    # (return the matched answer, guessed before or not; None if incorrect)
+    def _check_answer(
+        self, submitted_text: str, player: Player
+    ) -> Answer | None:
+        if self.event_log:
+            self.event_log.guess(player.name, submitted_text)
         current_question = self.get_current_question()
         # (just in case)
         if not current_question:
-            return
+            return None
         # special handling for incorrect AI guesses
         if submitted_text == "INVALID_AI_GUESS":
-            self.ui_manager.add_guess_popup(
-                "AI's Guess is Incorrect!", self.ai_player
-            )
-            return
+            self._add_guess_popup("AI's Guess is Incorrect!", self.ai_player)
+            return None
         found_answer = current_question.find_answer(
             submitted_text, player.name
         )
@@ -759,28 +1181,47 @@ class Game:
                 # correct and valid guess
                 found_answer.guess()
                 player.add_score(found_answer.points)
-                self.ui_manager.show_message(
+                if not self.headless:
+                    self.ui_manager.invalidate_board()
+                self._show_message(
                     f"Player: +{found_answer.points} points!", 1.5
                 )
-                self.ui_manager.add_guess_popup(found_answer.text, player)
-                self.audience.react_to_answer(found_answer, player)
+                self._add_guess_popup(found_answer.text, player)
+                if not self.headless:
+                    self.audience.react_to_answer(found_answer, player)
                 # sound effect for correct guess
-                correct_sound = pygame.mixer.Sound(f"Assets/correct.mp3")
-                correct_sound.set_volume(0.25)
-                correct_sound.play()
+                SoundBank.play_effect("correct")
                 # end the round if all answer is revealed
                 if current_question.is_fully_revealed():
                     self.round_time_remaining = 0
             else:
                 # correct but invalid guess
-                self.ui_manager.add_guess_popup("Already Guessed!", player)
+                self._add_guess_popup("Already Guessed!", player)
         else:
             # incorrect guess
-            self.ui_manager.add_guess_popup("Incorrect Guess!", player)
+            self._add_guess_popup("Incorrect Guess!", player)
             # sound effect for incorrect guess
-            incorrect_sound = pygame.mixer.Sound(f"Assets/incorrect.mp3")
-            incorrect_sound.set_volume(0.25)
-            incorrect_sound.play()
+            SoundBank.play_effect("incorrect")
+        return found_answer
+
+    # show a message on screen (nothing to show in headless mode)
+    def _show_message(self, text: str, duration: float):
+        if not self.headless:
+            self.ui_manager.show_message(text, duration)
+
+    # show a guess popup on screen (nothing to show in headless mode)
+    def _add_guess_popup(self, text: str, player: Player):
+        if not self.headless:
+            self.ui_manager.add_guess_popup(text, player)
+
+    # after a round ended: start the next round, or end the game
+    def _next_round_or_end_game(self):
+        if self.event_log:
+            self.event_log.next_round()
+        if self.round_number >= self.max_rounds:
+            self._end_game()
+        else:
+            self._start_new_round()
 
     # end the game by changing gamestate to GAME_OVER
     def _end_game(self):
@@ -790,12 +1231,17 @@ class Game:
     def change_state(self, new_state: GameState):
         if self.game_state != new_state:
             self.game_state = new_state
-            # deactivate input box if not racing
-            if new_state != GameState.RACE_ACTIVE:
-                self.ui_manager.input_box.active = False
-                self.ui_manager.input_box.color = (
-                    self.ui_manager.input_box.color_inactive
-                )
+            if self.event_log:
+                self.event_log.state(new_state)
+            if not self.headless:
+                # answers are revealed or a new question is shown
+                self.ui_manager.invalidate_board()
+                # deactivate input box if not racing
+                if new_state != GameState.RACE_ACTIVE:
+                    self.ui_manager.input_box.active = False
+                    self.ui_manager.input_box.color = (
+                        self.ui_manager.input_box.color_inactive
+                    )
 
     # get the current question by self.current_question_index
     def get_current_question(self) -> Question | None:
@@ -803,11 +1249,26 @@ class Game:
             return self.questions[self.current_question_index]
         return None
 
-    # generate new question
-    def _generate_new_questions(self):
-        try:
-            GenerateQuestions(AZURE_API_KEY)
-            self._load_questions("./Classes/Question/questions.json")
-            GenerateQuestionAudio()
-        except Exception as e:
-            print(f"Failed to generate new questions: {e}")
+    # add questions to the current set (arriving after it is adopted)
+    def _add_questions(self, question_data: list[dict]):
+        if self.event_log:
+            self.event_log.add_questions(question_data)
+        self.questions += [Question(q_data) for q_data in question_data]
+
+    # check if the question of the next round is still being prepared
+    def _is_next_question_pending(self) -> bool:
+        return (
+            self.question_worker is not None
+            and self.round_number < self.max_rounds
+            and self.current_question_index + 1 >= len(self.questions)
+            and self.question_worker.is_busy()
+        )
+
+    # use the newly generated questions if they are ready
+    def _adopt_new_questions(self) -> bool:
+        question_data = self.question_worker.adopt()
+        if not question_data:
+            return False
+        self.questions = [Question(q_data) for q_data in question_data]
+        SoundBank.load_voice_lines(self.question_worker.audio_paths)
+        return True
@@ -0,0 +1,146 @@
+from Classes.Game import Game
+from Classes.GameState import GameState
+from Classes.Player import Player
+
+
+class GameRoom:
+    """
+    Hold one room of the network server: a headless Game (questions, AI,
+    round timer) played by any number of human players.
+    Every method returns the events to be sent to the players of the room.
+    """
+
+    # seconds between the end of a round and the start of the next one
+    INTERMISSION = 5.0
+
+    def __init__(self, room_id: str, question_data: list[dict]):
+        self.room_id = room_id
+        self.game = Game(headless=True, question_data=question_data)
+        self.players: dict[str, Player] = {}
+        self.intermission_timer = 0.0
+        # indices of the answers of the current question already announced
+        self.revealed: set[int] = set()
+
+    # add a player to the room
+    def join(self, name: str) -> list[dict]:
+        self.players[name] = Player(name)
+        return [{"type": "joined", "room": self.room_id, "name": name}]
+
+    # remove a player from the room
+    def leave(self, name: str) -> list[dict]:
+        self.players.pop(name, None)
+        return [{"type": "left", "room": self.room_id, "name": name}]
+
+    # start a new game (ignored while a game is being played)
+    def start(self) -> list[dict]:
+        if self.game.game_state not in (GameState.MENU, GameState.GAME_OVER):
+            return []
+        for player in self.players.values():
+            player.reset_game_score()
+        self.game._start_new_game()
+        return self._round_start_events()
+
+    # check the guess of a player
+    def guess(self, name: str, text: str) -> list[dict]:
+        player = self.players.get(name)
+        question = self.game.get_current_question()
+        if (
+            player is None
+            or question is None
+            or self.game.game_state != GameState.RACE_ACTIVE
+        ):
+            return [{"type": "error", "message": "no round in progress"}]
+        points_before = player.round_score
+        answer = self.game._check_answer(text, player)
+        if answer is None:
+            result = "incorrect"
+        elif player.round_score > points_before:
+            result = "correct"
+        else:
+            result = "already_guessed"
+        events = [
+            {"type": "guess_result", "name": name, "result": result}
+        ]
+        return events + self._reveal_events()
+
+    # advance the room by dt seconds
+    def tick(self, dt: float) -> list[dict]:
+        state = self.game.game_state
+        if state == GameState.RACE_ACTIVE:
+            self.game._update(dt)  # round timer and AI player
+            events = self._reveal_events()
+            if self.game.game_state == GameState.RACE_END:
+                self.intermission_timer = self.INTERMISSION
+                events.append(self._round_end_event())
+            return events
+        if state == GameState.RACE_END:
+            self.intermission_timer -= dt
+            if self.intermission_timer <= 0:
+                self.game._next_round_or_end_game()
+                if self.game.game_state == GameState.GAME_OVER:
+                    return [{"type": "game_over", "scores": self._scores()}]
+                return self._round_start_events()
+        return []
+
+    # check if the room has no player
+    def is_empty(self) -> bool:
+        return not self.players
+
+    # helper function: events announcing a new round
+    def _round_start_events(self) -> list[dict]:
+        # round scores of the players are reset with the AI's
+        for player in self.players.values():
+            player.reset_round_score()
+        self.revealed = set()
+        question = self.game.get_current_question()
+        return [
+            {
+                "type": "round_start",
+                "round": self.game.round_number,
+                "max_rounds": self.game.max_rounds,
+                "question": question.text if question else "",
+                "num_answers": len(question.answers) if question else 0,
+                "time": self.game.round_time_total,
+            }
+        ]
+
+    # helper function: events for answers guessed since the last call
+    def _reveal_events(self) -> list[dict]:
+        question = self.game.get_current_question()
+        if question is None:
+            return []
+        events = []
+        for i, answer in enumerate(question.answers):
+            if answer.is_guessed and i not in self.revealed:
+                self.revealed.add(i)
+                events.append(
+                    {
+                        "type": "revealed",
+                        "index": i,
+                        "text": answer.text,
+                        "points": answer.points,
+                        "by": answer.who_guessed,
+                    }
+                )
+        return events
+
+    # helper function: event showing all answers at the end of a round
+    def _round_end_event(self) -> dict:
+        question = self.game.get_current_question()
+        return {
+            "type": "round_end",
+            "round": self.game.round_number,
+            "answers": [
+                {"text": answer.text, "points": answer.points}
+                for answer in (question.answers if question else [])
+            ],
+            "scores": self._scores(),
+        }
+
+    # helper function: game scores of all players and the AI
+    def _scores(self) -> dict[str, int]:
+        scores = {
+            name: player.game_score for name, player in self.players.items()
+        }
+        scores[self.game.ai_player.name] = self.game.ai_player.game_score
+        return scores
@@ -0,0 +1,80 @@
+import re
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+
+# normalize a text for matching: upper case, punctuation and
+# repeated spaces removed
+def normalize(text: str) -> str:
+    return " ".join(re.sub(r"[^0-9A-Z]+", " ", text.upper()).split())
+
+
+class AnswerMatcher:
+    """
+    Find the answer that best matches a guess, allowing minor typos.
+    The answers are normalized once, so that exact guesses are found with
+    a dict lookup, and answers that cannot beat the current best match are
+    skipped using the cheap upper bounds of SequenceMatcher.
+    """
+
+    def __init__(self, answer_texts: list[str], threshold: float = 0.7):
+        self.threshold = threshold
+        self.normalized: list[str] = [normalize(t) for t in answer_texts]
+        # normalized text -> index of the first answer with that text
+        self.exact: dict[str, int] = {}
+        for i, text in enumerate(self.normalized):
+            self.exact.setdefault(text, i)
+
+    # get a matcher shared by all questions with the same answers
+    # (e.g. the same question played in many rooms of the server)
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def shared(cls, answer_texts: tuple[str, ...]) -> "AnswerMatcher":
+        return cls(list(answer_texts))
+
+    # return the index of the best matching answer (None if no answer has
+    # similarity above the threshold); ties go to the earlier answer
+    def best_match(self, guess: str) -> int | None:
+        search_text = normalize(guess)
+        index = self.exact.get(search_text)
+        if index is not None:
+            return index
+        matcher = SequenceMatcher()
+        # seq2 is the one SequenceMatcher preprocesses, set it only once
+        matcher.set_seq2(search_text)
+        best_index = None
+        best_score = self.threshold
+        candidates = []
+        for i, text in enumerate(self.normalized):
+            matcher.set_seq1(text)
+            bound = matcher.real_quick_ratio()
+            if bound > best_score:
+                candidates.append((-bound, i))
+        # most promising answers first, so that later ones can be pruned
+        for neg_bound, i in sorted(candidates):
+            if -neg_bound < best_score:
+                break
+            matcher.set_seq1(self.normalized[i])
+            bound = matcher.quick_ratio()
+            if not self._beats(bound, i, best_score, best_index):
+                continue
+            score = matcher.ratio()
+            if self._beats(score, i, best_score, best_index):
+                best_score = score
+                best_index = i
+        return best_index
+
+    # helper function: check if answer i with the given score would
+    # replace the current best match
+    @staticmethod
+    def _beats(score, i, best_score, best_index) -> bool:
+        if score > best_score:
+            return True
+        # equal score: the earlier answer wins
+        return (
+            score == best_score and best_index is not None and i < best_index
+        )
+
+    # best_match() for a batch of guesses
+    def best_matches(self, guesses: list[str]) -> list[int | None]:
+        return [self.best_match(guess) for guess in guesses]
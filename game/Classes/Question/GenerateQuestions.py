@@ -9,30 +9,36 @@ Install the required packages in your virtual environment:
 pip install dotenv openai
 """
 
-from openai import AzureOpenAI
+import itertools
 import json
+import random
+import time
+from typing import Callable
 
+from Classes.Question.LLMClient import LLMClient
+from Classes.Question.QuestionStreamParser import QuestionStreamParser
+from Classes.Question.QuestionValidator import (
+    MAX_ANSWER_LENGTH,
+    NUM_ANSWERS,
+    TOTAL_POINTS,
+    get_question_errors,
+    is_valid_question,
+)
+from Classes.Question.ResponseCache import ResponseCache
 
-def GenerateQuestions(AZURE_API_KEY):
-
-    output_path = "./Classes/Question/questions.json"
-
-    # Initialize the client
-    client = AzureOpenAI(
-        azure_endpoint="https://cuhk-apip.azure-api.net",
-        api_version="2024-02-01",  # Use appropriate version for your model
-        api_key=AZURE_API_KEY,
-    )
-
-    # Chat with gpt-4o-mini or gpt-4o
-    response = client.chat.completions.create(
-        model="gpt-4o",
-        messages=[
-            {"role": "system", "content": "You are a helpful assistant."},
-            {
-                "role": "user",
-                "content": (
-                    """
+MODEL = "gpt-4o"  # gpt-4o-mini or gpt-4o
+TEMPERATURE = 0.7  # Control response creativity (0-1)
+# number of different question sets asked for the same prompt
+# (each variant is cached separately)
+NUM_VARIANTS = 8
+# number of questions asked in the prompt
+NUM_QUESTIONS = 3
+# requests for the questions missing after the first reply
+MAX_REPAIRS = 2
+# seconds to wait for a whole set before using cached questions instead
+# (only when there are cached questions)
+CACHE_DEADLINE = 10.0
+PROMPT = """
 Instruction: Create 3 questions, each with 6 most popular answers with
 respective scores corresponding to how 'popular' the answer is,
 for playing the 'Guess Their Answer' game.
@@ -65,18 +71,221 @@ Try not to directly copy this example in your output.
     }
 ]
 ```
-                    """
-                ),
-            },
+"""
+# prompt asking only for the missing questions (in json mode, so that the
+# reply is a json object)
+REPAIR_PROMPT = """
+Create {count} more question(s) for the 'Guess Their Answer' game,
+each with exactly {num_answers} most popular answers with respective
+points corresponding to how 'popular' the answer is.
+The points of a question should sum to {total_points}.
+Each answer should not exceed {max_length} characters, and should not
+contain short forms, with proper English words.
+The questions should be related to Hong Kong culture, for Hong Kong
+people.
+{rejected}
+Do not repeat these questions:
+{existing}
+
+Output a json object:
+{{"questions": [{{"question": "...",
+"answers": [{{"text": "...", "points": 30}}, ...]}}]}}
+"""
+
+
+def GenerateQuestions(
+    AZURE_API_KEY,
+    output_path="./Classes/Question/questions.json",
+    on_question: Callable[[dict], None] | None = None,
+    variant: int | None = None,
+    cache: ResponseCache | None = None,
+) -> list[dict]:
+    """
+    Generate questions with the chat model and save them to output_path
+    (not saved if output_path is None).
+    The reply is streamed: each question is parsed and validated as soon
+    as it is complete, and passed to on_question while the next ones are
+    still being generated. Only the missing (or invalid) questions are
+    asked again, up to MAX_REPAIRS times.
+    With a cache, the replies are kept, and the cached replies (to the
+    same request first, variant: random if None) complete the set if the
+    model cannot be reached, or has not replied with a whole set within
+    CACHE_DEADLINE seconds. They are never used instead of asking the
+    model: new questions are asked for because the played ones ran out.
+    """
+    if variant is None:
+        variant = random.randrange(NUM_VARIANTS)
+    prompt = PROMPT
+    if variant:
+        prompt += f"\n(Question set #{variant + 1})\n"
+    key = ResponseCache.make_key(MODEL, prompt, TEMPERATURE, variant)
+    # do not wait for a slow model when cached questions can be served
+    deadline = None
+    if cache and next(cache.get_latest(), None):
+        deadline = time.monotonic() + CACHE_DEADLINE
+
+    output_json = []
+    try:
+        rejected = _stream_questions(
+            AZURE_API_KEY, prompt, output_json, on_question, deadline
+        )
+        for _ in range(MAX_REPAIRS):
+            if len(output_json) >= NUM_QUESTIONS:
+                break
+            rejected = _request_missing_questions(
+                AZURE_API_KEY, output_json, rejected, on_question, deadline
+            )
+        if not output_json:
+            raise ValueError("no valid question in the response")
+    except Exception as e:
+        if not cache:
+            raise
+        print(f"Cannot generate questions ({e}), using cached ones")
+        _use_cached_questions(cache, key, output_json, on_question)
+    else:
+        # (a set still short after the repairs is not kept)
+        if cache and len(output_json) >= NUM_QUESTIONS:
+            cache.put(key, output_json)
+
+    # Dumping the text variable to a JSON file
+    if output_path is not None:
+        with open(output_path, "w") as json_file:
+            # noinspection PyTypeChecker
+            json.dump(output_json, json_file, indent=4)
+
+    return output_json
+
+
+# helper function: ask the model, adding each valid question of the reply
+# to questions (and passing it to on_question) as soon as it is complete
+# (return the invalid questions and their errors; raise TimeoutError if
+# the reply is not complete at the deadline)
+def _stream_questions(
+    AZURE_API_KEY,
+    prompt: str,
+    questions: list[dict],
+    on_question: Callable[[dict], None] | None,
+    deadline: float | None = None,
+) -> list[tuple[dict | str, list[str]]]:
+    # (through the shared client, reusing its connections)
+    response = LLMClient.create_chat_completion(
+        AZURE_API_KEY,
+        deadline,
+        model=MODEL,
+        messages=[
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": prompt},
         ],
-        temperature=0.7,  # Control response creativity (0-1)
+        temperature=TEMPERATURE,
+        stream=True,
     )
+    parser = QuestionStreamParser()
+    for chunk in response:
+        # (the reply may still trickle in after the deadline)
+        if deadline is not None and time.monotonic() > deadline:
+            response.close()
+            raise TimeoutError("the reply is not complete at the deadline")
+        # (some chunks have no choice, e.g. content filter results)
+        if not chunk.choices or not chunk.choices[0].delta.content:
+            continue
+        for question in parser.feed(chunk.choices[0].delta.content):
+            questions.append(question)
+            if on_question:
+                on_question(question)
+    return parser.rejected
 
-    ai_response = response.choices[0].message.content
-    output_text = ai_response.split("```")[1].replace("json", "").strip()
-    output_json = json.loads(output_text)
 
-    # Dumping the text variable to a JSON file
-    with open(output_path, "w") as json_file:
-        # noinspection PyTypeChecker
-        json.dump(output_json, json_file, indent=4)
+# helper function: ask the model for the questions missing from a reply
+# only, telling why the rejected ones were invalid, and add the valid
+# ones to questions (return the invalid questions and their errors)
+def _request_missing_questions(
+    AZURE_API_KEY,
+    questions: list[dict],
+    rejected: list[tuple[dict | str, list[str]]],
+    on_question: Callable[[dict], None] | None,
+    deadline: float | None = None,
+) -> list[tuple[dict | str, list[str]]]:
+    count = NUM_QUESTIONS - len(questions)
+    rejected_lines = [
+        "These questions were rejected (fix or replace them):"
+    ] + [
+        f"- {_describe(question)}: {'; '.join(errors)}"
+        for question, errors in rejected
+    ]
+    prompt = REPAIR_PROMPT.format(
+        count=count,
+        num_answers=NUM_ANSWERS,
+        total_points=TOTAL_POINTS,
+        max_length=MAX_ANSWER_LENGTH,
+        rejected="\n".join(rejected_lines) if rejected else "",
+        existing="\n".join(f"- {q['question']}" for q in questions),
+    )
+    response = LLMClient.create_chat_completion(
+        AZURE_API_KEY,
+        deadline,
+        model=MODEL,
+        messages=[
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": prompt},
+        ],
+        temperature=TEMPERATURE,
+        response_format={"type": "json_object"},
+    )
+    try:
+        reply = json.loads(response.choices[0].message.content)
+        new_questions = reply["questions"]
+        if not isinstance(new_questions, list):
+            raise TypeError
+    except (ValueError, KeyError, TypeError):
+        return [("the reply", ["not a json object with questions"])]
+    texts = {q["question"] for q in questions}
+    still_rejected = []
+    for question in new_questions[:count]:
+        errors = get_question_errors(question)
+        if not errors and question["question"] in texts:
+            errors = ["repeats an existing question"]
+        if errors:
+            still_rejected.append((question, errors))
+            continue
+        texts.add(question["question"])
+        questions.append(question)
+        if on_question:
+            on_question(question)
+    return still_rejected
+
+
+# helper function: short description of a rejected question
+def _describe(question: dict | str) -> str:
+    if isinstance(question, dict) and isinstance(
+        question.get("question"), str
+    ):
+        return f'"{question["question"]}"'
+    return "a question"
+
+
+# helper function: complete questions up to a whole set with cached
+# ones (of the same request first, then of the latest replies), skipping
+# those already received (raise if there is none)
+def _use_cached_questions(
+    cache: ResponseCache,
+    key: str,
+    questions: list[dict],
+    on_question: Callable[[dict], None] | None,
+):
+    texts = {q["question"] for q in questions}
+    same_request = cache.get(key)
+    for cached in itertools.chain([same_request or []], cache.get_latest()):
+        for question in cached:
+            if len(questions) >= NUM_QUESTIONS:
+                return
+            if (
+                not is_valid_question(question)
+                or question["question"] in texts
+            ):
+                continue
+            texts.add(question["question"])
+            questions.append(question)
+            if on_question:
+                on_question(question)
+    if not questions:
+        raise ValueError("no cached questions to use offline")
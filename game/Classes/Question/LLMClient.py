@@ -0,0 +1,143 @@
+import os
+import random
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from openai import AzureOpenAI
+
+
+class LLMClient:
+    """
+    Hold the clients of the chat model, shared by every request, so that
+    the connections to the endpoint are kept alive between games instead
+    of being opened again for each question set.
+    Requests time out instead of hanging, and are retried after a jittered
+    exponential backoff on transient errors (never past the deadline of
+    the caller, if any).
+    The openai and httpx packages are only imported with the first client
+    (they take most of the startup time of the game otherwise).
+    The endpoint can be changed with the LLM_BASE_URL environment variable,
+    e.g. to use mock_llm_server.py in tests and benchmarks (the timeouts
+    and retries with LLM_CONNECT_TIMEOUT, LLM_READ_TIMEOUT and
+    LLM_MAX_RETRIES).
+    """
+
+    DEFAULT_BASE_URL = "https://cuhk-apip.azure-api.net"
+    API_VERSION = "2024-02-01"  # Use appropriate version for your model
+    # seconds to connect, and to wait for each piece of the response
+    CONNECT_TIMEOUT = 5.0
+    READ_TIMEOUT = 30.0
+    MAX_RETRIES = 3
+    # backoff before retry n: random between 0 and
+    # min(BACKOFF_CAP, BACKOFF_BASE * 2 ** n) seconds
+    BACKOFF_BASE = 0.5
+    BACKOFF_CAP = 8.0
+
+    _clients: dict[tuple[str, str], "AzureOpenAI"] = {}
+    _lock = threading.Lock()
+
+    # get the shared client of an api key (created on first use)
+    @classmethod
+    def get_client(cls, api_key: str | None) -> "AzureOpenAI":
+        base_url = cls.get_base_url()
+        key = (base_url, api_key or "")
+        with cls._lock:
+            client = cls._clients.get(key)
+            if client is None:
+                import httpx
+                from openai import AzureOpenAI
+
+                client = AzureOpenAI(
+                    azure_endpoint=base_url,
+                    api_version=cls.API_VERSION,
+                    api_key=api_key,
+                    # retries are done by create_chat_completion()
+                    max_retries=0,
+                    http_client=httpx.Client(
+                        timeout=httpx.Timeout(
+                            cls._get_setting("LLM_READ_TIMEOUT"),
+                            connect=cls._get_setting("LLM_CONNECT_TIMEOUT"),
+                        ),
+                        limits=httpx.Limits(
+                            max_connections=4,
+                            max_keepalive_connections=4,
+                            keepalive_expiry=300,
+                        ),
+                    ),
+                )
+                cls._clients[key] = client
+            return client
+
+    # create a chat completion (the arguments of
+    # client.chat.completions.create), retrying on transient errors
+    # (a streamed completion is only retried until it starts)
+    # deadline: time.monotonic() after which no request is waited for
+    # (TimeoutError is raised then)
+    @classmethod
+    def create_chat_completion(
+        cls, api_key: str | None, deadline: float | None = None, **kwargs
+    ):
+        client = cls.get_client(api_key)
+        import httpx
+        import openai
+
+        # errors worth retrying (network errors, timeouts, 429 and 5xx)
+        transient_errors = (
+            openai.APIConnectionError,  # (including timeouts)
+            openai.RateLimitError,
+            openai.InternalServerError,
+        )
+        max_retries = int(cls._get_setting("LLM_MAX_RETRIES"))
+        for attempt in range(max_retries + 1):
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("no reply before the deadline")
+                # (never wait for the endpoint past the deadline)
+                kwargs["timeout"] = httpx.Timeout(
+                    min(cls._get_setting("LLM_READ_TIMEOUT"), remaining),
+                    connect=min(
+                        cls._get_setting("LLM_CONNECT_TIMEOUT"), remaining
+                    ),
+                )
+            try:
+                return client.chat.completions.create(**kwargs)
+            except transient_errors as e:
+                delay = cls.get_backoff(attempt)
+                if attempt == max_retries or (
+                    deadline is not None
+                    and time.monotonic() + delay >= deadline
+                ):
+                    raise
+                print(f"Chat request failed ({e}), retry in {delay:.1f} s")
+                time.sleep(delay)
+
+    # get the endpoint of the chat model
+    @classmethod
+    def get_base_url(cls) -> str:
+        return os.getenv("LLM_BASE_URL") or cls.DEFAULT_BASE_URL
+
+    # get the delay before retry n (full jitter, so that many clients
+    # failing together do not retry together)
+    @classmethod
+    def get_backoff(cls, attempt: int) -> float:
+        return random.uniform(
+            0, min(cls.BACKOFF_CAP, cls.BACKOFF_BASE * 2**attempt)
+        )
+
+    # close every client (and its connections)
+    @classmethod
+    def close(cls):
+        with cls._lock:
+            for client in cls._clients.values():
+                client.close()
+            cls._clients = {}
+
+    # helper function: a setting from the environment variable (read when
+    # used, after the .env file is loaded), or its default
+    @classmethod
+    def _get_setting(cls, name: str) -> float:
+        default = getattr(cls, name.removeprefix("LLM_"))
+        return float(os.getenv(name, default))
@@ -1,10 +1,5 @@
-from difflib import SequenceMatcher
 from Classes.Answer import Answer
-
-
-# return the similarity score between two strings
-def similar(a, b) -> float:
-    return SequenceMatcher(None, a, b).ratio()
+from Classes.Question.AnswerMatcher import AnswerMatcher
 
 
 class Question:
@@ -22,26 +17,26 @@ class Question:
             self.answers.append(Answer(ans_data["text"], ans_data["points"]))
         # sort the answers by their point (high to low)
         self.answers.sort(key=lambda x: x.points, reverse=True)
+        # index the answers for matching guesses
+        self.matcher = AnswerMatcher.shared(
+            tuple(ans.text for ans in self.answers)
+        )
 
     # get a list of all unguessed answers
     def get_unguessed_answers(self) -> list[Answer]:
         return [ans for ans in self.answers if not ans.is_guessed]
 
     # find answer according to player's input
+    # (the best match, allowing some minor typo)
     def find_answer(self, text: str, who_guessed) -> Answer | None:
-        search_text = text.strip().upper()
-        for ans in self.answers:
-            # if ans.text == search_text:
-            if (
-                # just in case some minor typo
-                similar(ans.text, search_text)
-                > 0.7
-            ):
-                # record who guessed the answer
-                if not ans.is_guessed:
-                    ans.who_guessed = who_guessed
-                return ans
-        return None
+        index = self.matcher.best_match(text)
+        if index is None:
+            return None
+        ans = self.answers[index]
+        # record who guessed the answer
+        if not ans.is_guessed:
+            ans.who_guessed = who_guessed
+        return ans
 
     # check if the question is fully revealed
     def is_fully_revealed(self) -> bool:
@@ -51,3 +46,13 @@ class Question:
     def reset(self):
         for ans in self.answers:
             ans.reset()
+
+    # get the question as a dict in the questions.json format
+    def to_data(self) -> dict:
+        return {
+            "question": self.text,
+            "answers": [
+                {"text": ans.text, "points": ans.points}
+                for ans in self.answers
+            ],
+        }
@@ -0,0 +1,144 @@
+import random
+import sqlite3
+import time
+from contextlib import closing
+
+
+class QuestionBank:
+    """
+    Hold every generated question (and its answers) in a SQLite database,
+    so that questions accumulate across sessions and a game can start from
+    the bank instead of waiting for new questions to be generated.
+    Each question records when it was last played, so that unplayed
+    questions are picked first.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS questions (
+            id INTEGER PRIMARY KEY,
+            topic TEXT NOT NULL,
+            text TEXT NOT NULL UNIQUE,
+            created_at REAL NOT NULL,
+            last_played REAL
+        );
+        CREATE TABLE IF NOT EXISTS answers (
+            question_id INTEGER NOT NULL REFERENCES questions (id),
+            text TEXT NOT NULL,
+            points INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS questions_by_topic_and_last_played
+            ON questions (topic, last_played);
+        CREATE INDEX IF NOT EXISTS questions_by_last_played
+            ON questions (last_played);
+        CREATE INDEX IF NOT EXISTS answers_by_question
+            ON answers (question_id);
+    """
+
+    def __init__(self, path: str = "./Classes/Question/question_bank.db"):
+        self.path = path
+        with closing(self._connect()) as conn:
+            conn.executescript(self.SCHEMA)
+
+    # add questions (dicts in the questions.json format) to the bank,
+    # questions already in the bank are skipped
+    # (return the number of questions added)
+    def add_questions(self, questions: list[dict], topic: str = "") -> int:
+        added = 0
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            for q_data in questions:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO questions (topic, text, created_at)"
+                    " VALUES (?, ?, ?)",
+                    (topic, q_data["question"], now),
+                )
+                if cursor.rowcount == 0:
+                    continue  # already in the bank
+                conn.executemany(
+                    "INSERT INTO answers (question_id, text, points)"
+                    " VALUES (?, ?, ?)",
+                    [
+                        (cursor.lastrowid, ans["text"], ans["points"])
+                        for ans in q_data.get("answers", [])
+                    ],
+                )
+                added += 1
+        return added
+
+    # count the questions that have never been played
+    def count_unplayed(self, topic: str | None = None) -> int:
+        where, params = self._topic_filter(topic)
+        with closing(self._connect()) as conn:
+            return conn.execute(
+                f"SELECT COUNT(*) FROM questions"
+                f" WHERE last_played IS NULL{where}",
+                params,
+            ).fetchone()[0]
+
+    # pick n questions at random among the unplayed ones, topped up with
+    # the least recently played ones if there are not enough
+    # (return dicts in the questions.json format)
+    def sample(self, n: int, topic: str | None = None) -> list[dict]:
+        where, params = self._topic_filter(topic)
+        with closing(self._connect()) as conn:
+            # only the ids are read, to pick from them at random
+            unplayed = [
+                row[0]
+                for row in conn.execute(
+                    f"SELECT id FROM questions"
+                    f" WHERE last_played IS NULL{where}",
+                    params,
+                )
+            ]
+            ids = random.sample(unplayed, min(n, len(unplayed)))
+            if len(ids) < n:
+                ids += [
+                    row[0]
+                    for row in conn.execute(
+                        f"SELECT id FROM questions"
+                        f" WHERE last_played IS NOT NULL{where}"
+                        f" ORDER BY last_played LIMIT ?",
+                        params + [n - len(ids)],
+                    )
+                ]
+            return [self._load_question(conn, q_id) for q_id in ids]
+
+    # record that the questions (by their text) are played now
+    def mark_played(self, question_texts: list[str]):
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "UPDATE questions SET last_played = ? WHERE text = ?",
+                [(now, text) for text in question_texts],
+            )
+
+    # helper function: open a connection (one per call, so that the bank
+    # can be used from the question worker thread and the game loop)
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path)
+
+    # helper function: SQL condition restricting questions to a topic
+    @staticmethod
+    def _topic_filter(topic: str | None) -> tuple[str, list]:
+        if topic is None:
+            return "", []
+        return " AND topic = ?", [topic]
+
+    # helper function: read a question and its answers
+    @staticmethod
+    def _load_question(conn: sqlite3.Connection, q_id: int) -> dict:
+        text = conn.execute(
+            "SELECT text FROM questions WHERE id = ?", (q_id,)
+        ).fetchone()[0]
+        answers = conn.execute(
+            "SELECT text, points FROM answers WHERE question_id = ?"
+            " ORDER BY rowid",
+            (q_id,),
+        ).fetchall()
+        return {
+            "question": text,
+            "answers": [
+                {"text": ans_text, "points": points}
+                for ans_text, points in answers
+            ],
+        }
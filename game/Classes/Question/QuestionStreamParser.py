@@ -0,0 +1,66 @@
+import json
+
+from Classes.Question.QuestionValidator import get_question_errors
+
+
+class QuestionStreamParser:
+    """
+    Parse the questions of a reply while it is being streamed: the reply
+    holds a json array of question objects (possibly in a ``` block), and
+    each object is parsed as soon as its closing brace arrives, instead of
+    waiting for the whole array.
+    Every question is validated on its own: invalid ones are kept aside
+    with their errors, so that only they need to be asked again.
+    """
+
+    def __init__(self):
+        self.depth = 0  # nesting of the braces of the current object
+        self.in_string = False
+        self.escaped = False
+        self.chars: list[str] = []  # characters of the current object
+        # invalid questions (or their text if not json) and their errors
+        self.rejected: list[tuple[dict | str, list[str]]] = []
+
+    # add the next piece of the reply
+    # (return the valid questions completed by this piece)
+    def feed(self, text: str) -> list[dict]:
+        questions = []
+        for ch in text:
+            if self.depth == 0:
+                # skip everything between the question objects
+                if ch == "{":
+                    self.depth = 1
+                    self.chars = [ch]
+                continue
+            self.chars.append(ch)
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch == "{":
+                self.depth += 1
+            elif ch == "}":
+                self.depth -= 1
+                if self.depth == 0:
+                    question = self._parse("".join(self.chars))
+                    if question is not None:
+                        questions.append(question)
+        return questions
+
+    # helper function: the question in a json object, None if invalid
+    def _parse(self, text: str) -> dict | None:
+        try:
+            question = json.loads(text)
+        except ValueError:
+            self.rejected.append((text, ["not valid json"]))
+            return None
+        errors = get_question_errors(question)
+        if errors:
+            self.rejected.append((question, errors))
+            return None
+        return question
@@ -0,0 +1,60 @@
+# rules of a question of the game (stated in the prompt, and checked on
+# every generated question)
+NUM_ANSWERS = 6
+TOTAL_POINTS = 100
+MAX_ANSWER_LENGTH = 20
+
+
+# get the rules broken by a question (in the questions.json format)
+# (empty if the question is valid)
+def get_question_errors(question) -> list[str]:
+    if not isinstance(question, dict):
+        return ["not a json object"]
+    errors = []
+    text = question.get("question")
+    if not isinstance(text, str) or not text.strip():
+        errors.append("no question text")
+    answers = question.get("answers")
+    if not isinstance(answers, list):
+        return errors + ["no answers"]
+    if len(answers) != NUM_ANSWERS:
+        errors.append(f"{len(answers)} answers instead of {NUM_ANSWERS}")
+    total = 0
+    valid_points = True
+    seen = set()
+    for ans in answers:
+        if not isinstance(ans, dict):
+            errors.append("an answer is not a json object")
+            valid_points = False
+            continue
+        ans_text = ans.get("text")
+        if not isinstance(ans_text, str) or not ans_text.strip():
+            errors.append("an answer has no text")
+        else:
+            ans_text = ans_text.strip()
+            if len(ans_text) > MAX_ANSWER_LENGTH:
+                errors.append(
+                    f'answer "{ans_text}" is longer than'
+                    f" {MAX_ANSWER_LENGTH} characters"
+                )
+            if ans_text.upper() in seen:
+                errors.append(f'answer "{ans_text}" is repeated')
+            seen.add(ans_text.upper())
+        points = ans.get("points")
+        # (bool is a subclass of int)
+        if not isinstance(points, int) or isinstance(points, bool):
+            errors.append(f'answer "{ans_text}" has no integer points')
+            valid_points = False
+        elif points <= 0:
+            errors.append(f'answer "{ans_text}" has {points} points')
+            valid_points = False
+        else:
+            total += points
+    if valid_points and total != TOTAL_POINTS:
+        errors.append(f"points sum to {total} instead of {TOTAL_POINTS}")
+    return errors
+
+
+# check if a question follows every rule
+def is_valid_question(question) -> bool:
+    return not get_question_errors(question)
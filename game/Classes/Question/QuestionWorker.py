@@ -0,0 +1,221 @@
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from Classes.Question.GenerateQuestions import GenerateQuestions
+from Classes.Question.QuestionBank import QuestionBank
+from Classes.Question.ResponseCache import ResponseCache
+from Classes.Question.TTSCache import TTSCache
+
+
+class QuestionWorker:
+    """
+    Prepare the next question set (questions and their audio) on a
+    background thread, so that the game loop never waits for the network.
+    Questions are taken from the question bank, and only generated when
+    the bank runs out of unplayed questions.
+    Each question is published as soon as it and its audio are ready:
+    the game adopts the set when its first question is ready (between
+    games), and takes the following questions as they arrive.
+    Only data in memory changes hands with the game: the questions taken
+    are saved for the next launch (questions.json and its audio) and
+    marked as played in the bank on a saving thread.
+    """
+
+    # number of questions in a set (one per round)
+    NUM_QUESTIONS = 3
+
+    # the set loaded at the next launch, and its audio
+    QUESTIONS_PATH = "./Classes/Question/questions.json"
+    AUDIO_PATH = "Assets/Q{}.mp3"
+
+    def __init__(self, api_key: str | None):
+        self.api_key = api_key
+        self.lock = threading.Lock()
+        self.thread: threading.Thread | None = None
+        # questions of the set being prepared: ready but not taken by the
+        # game (and their audio clips), and taken by the game
+        self.next_questions: list[dict] = []
+        self.next_clips: list[str] = []
+        self.taken: list[dict] = []
+        # audio clips of the questions taken (only used by the game thread)
+        self.audio_paths: list[str] = []
+        self.num_prepared = 0
+        self.preparing = False
+        self.adopted = False  # the game plays the set being prepared
+        self.start_requested = False
+        self.question_bank = QuestionBank()
+        self.tts_cache = TTSCache()
+        self.response_cache = ResponseCache()
+        # the thread saving the questions taken (in the order taken), and
+        # the last save
+        self.saver = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="QuestionSaver"
+        )
+        self.last_save: Future | None = None
+
+    # start generating the next set (if not generating or already done)
+    def start(self):
+        with self.lock:
+            if self.adopted:
+                # the set is still being played, prepare the next one
+                # when the game has taken all of it
+                self.start_requested = True
+                return
+            if self.is_busy() or self.next_questions:
+                return
+            self._start_thread()
+
+    # check if the next set is being generated
+    def is_busy(self) -> bool:
+        return self.preparing
+
+    # check if the first question of the next set is ready
+    def is_ready(self) -> bool:
+        with self.lock:
+            return not self.adopted and len(self.next_questions) > 0
+
+    # replace the current set with the next set, with its questions
+    # ready so far (the others are taken by adopt_more())
+    # (return them, in the questions.json format, their audio clips are
+    # then in audio_paths; empty if no question of the next set is ready)
+    def adopt(self) -> list[dict]:
+        with self.lock:
+            if self.adopted or not self.next_questions:
+                return []
+            self.adopted = True
+            self.taken = []
+            self.audio_paths = []
+            return self._take()
+
+    # take the questions of the adopted set that are ready since the
+    # last call (return them, in the questions.json format)
+    def adopt_more(self) -> list[dict]:
+        with self.lock:
+            if not self.adopted:
+                return []
+            return self._take()
+
+    # helper function: start the worker thread on a new set
+    # (call with the lock held)
+    def _start_thread(self):
+        self.next_questions = []
+        self.next_clips = []
+        self.num_prepared = 0
+        self.preparing = True
+        self.thread = threading.Thread(target=self._generate, daemon=True)
+        self.thread.start()
+
+    # helper function: move the ready questions of the adopted set to the
+    # current set, and have them saved (call with the lock held)
+    def _take(self) -> list[dict]:
+        questions = self.next_questions
+        self.next_questions = []
+        if questions:
+            first = len(self.taken)
+            self.taken += questions
+            self.audio_paths += self.next_clips
+            self.next_clips = []
+            self.last_save = self.saver.submit(
+                self._save, list(self.taken), list(self.audio_paths), first
+            )
+        self._check_set_taken()
+        return questions
+
+    # helper function: once the adopted set is prepared and taken, prepare
+    # the next set if requested (call with the lock held)
+    def _check_set_taken(self):
+        if (
+            self.adopted
+            and not self.preparing
+            and self.num_prepared == len(self.taken)
+        ):
+            self.adopted = False
+            if self.start_requested:
+                self.start_requested = False
+                self._start_thread()
+
+    # helper function: save the questions taken from index first on, for
+    # the next launch, and mark them as played (run on the saving thread)
+    def _save(self, taken: list[dict], clips: list[str], first: int):
+        try:
+            # each file is replaced at once, never left half-written
+            for n in range(first + 1, len(taken) + 1):
+                temp_path = f"{self.AUDIO_PATH.format(n)}.tmp"
+                shutil.copyfile(clips[n - 1], temp_path)
+                os.replace(temp_path, self.AUDIO_PATH.format(n))
+            temp_path = f"{self.QUESTIONS_PATH}.tmp"
+            with open(temp_path, "w") as json_file:
+                json.dump(taken, json_file, indent=4)
+            os.replace(temp_path, self.QUESTIONS_PATH)
+            self.question_bank.mark_played(
+                [q["question"] for q in taken[first:]]
+            )
+        except Exception as e:
+            print(f"Failed to save the questions taken: {e}")
+
+    # helper function: prepare the next set (run on the worker thread)
+    def _generate(self):
+        try:
+            # the questions taken before are marked as played first
+            if self.last_save:
+                self.last_save.result()
+            # generate new questions only if the bank runs out
+            if self.question_bank.count_unplayed() < self.NUM_QUESTIONS:
+                try:
+                    # questions are used as soon as they are generated
+                    GenerateQuestions(
+                        self.api_key,
+                        None,
+                        on_question=self._add_generated,
+                        cache=self.response_cache,
+                    )
+                except Exception as e:
+                    # replay the least recently played questions instead
+                    print(f"Failed to generate new questions: {e}")
+            # complete the set with questions from the bank
+            missing = self.NUM_QUESTIONS - self.num_prepared
+            if missing > 0:
+                with self.lock:
+                    prepared = {
+                        q["question"] for q in self.next_questions + self.taken
+                    }
+                questions = [
+                    q
+                    for q in self.question_bank.sample(
+                        missing + len(prepared)
+                    )
+                    if q["question"] not in prepared
+                ][:missing]
+                if not questions and self.num_prepared == 0:
+                    raise ValueError(
+                        "not enough questions in the question bank"
+                    )
+                # synthesise the missing audio of the whole set at once
+                clips = self.tts_cache.get_clips(
+                    [q["question"] for q in questions]
+                )
+                for q, clip in zip(questions, clips):
+                    self._publish(q, clip)
+        except Exception as e:
+            print(f"Failed to prepare new questions: {e}")
+        finally:
+            with self.lock:
+                self.preparing = False
+                self._check_set_taken()
+
+    # helper function: add a generated question to the bank and to the set
+    def _add_generated(self, question: dict):
+        self.question_bank.add_questions([question])
+        if self.num_prepared < self.NUM_QUESTIONS:
+            clip = self.tts_cache.get_clips([question["question"]])[0]
+            self._publish(question, clip)
+
+    # helper function: publish a question once its audio clip is ready
+    def _publish(self, question: dict, clip: str):
+        with self.lock:
+            self.next_questions.append(question)
+            self.next_clips.append(clip)
+            self.num_prepared += 1
@@ -0,0 +1,103 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Iterator
+
+
+class ResponseCache:
+    """
+    Hold the questions generated for each request to the chat model in a
+    cache directory, named by a hash of (model, prompt, temperature,
+    variant), to be served when the model cannot be reached (or is too
+    slow).
+    Entries expire after ttl seconds (they are never served, and removed
+    with the next put()), and only the newest max_entries are kept.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = "./Classes/Question/response_cache",
+        ttl: float = 7 * 24 * 3600,
+        max_entries: int = 64,
+    ):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max_entries
+        os.makedirs(cache_dir, exist_ok=True)
+
+    # get the key of a request
+    @staticmethod
+    def make_key(
+        model: str, prompt: str, temperature: float, variant: int
+    ) -> str:
+        return hashlib.sha256(
+            json.dumps([model, prompt, temperature, variant]).encode("utf-8")
+        ).hexdigest()
+
+    # get the cached questions of a request
+    # (None if not cached, or older than the ttl)
+    def get(self, key: str) -> list | None:
+        path = self._get_path(key)
+        try:
+            if self._get_age(path) > self.ttl:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    # get the questions of the cached requests from the newest, until the
+    # first expired one (each entry is only read when iterated)
+    def get_latest(self) -> Iterator[list[dict]]:
+        for path in self._get_paths_newest_first():
+            try:
+                if self._get_age(path) > self.ttl:
+                    return  # (the next ones are older)
+                with open(path, "r", encoding="utf-8") as f:
+                    yield json.load(f)
+            except (OSError, ValueError):
+                continue
+
+    # cache the questions of a request
+    def put(self, key: str, questions: list[dict]):
+        path = self._get_path(key)
+        # written to a temporary file first, so that a half-written entry
+        # is never read
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(questions, f)
+        os.replace(temp_path, path)
+        # remove the oldest entries beyond the limit, and expired ones
+        paths = self._get_paths_newest_first()
+        for i, old_path in enumerate(paths):
+            try:
+                if i >= self.max_entries or self._get_age(old_path) > self.ttl:
+                    os.remove(old_path)
+            except OSError:
+                pass  # removed meanwhile
+
+    # helper function: path of the entry of a key
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    # helper function: paths of all entries, from the newest
+    def _get_paths_newest_first(self) -> list[str]:
+        paths = [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir)
+            if name.endswith(".json")
+        ]
+        ages = {}
+        for path in paths:
+            try:
+                ages[path] = self._get_age(path)
+            except OSError:
+                pass  # removed meanwhile
+        return sorted(ages, key=ages.get)
+
+    # helper function: seconds since an entry was written
+    @staticmethod
+    def _get_age(path: str) -> float:
+        return time.time() - os.path.getmtime(path)
@@ -0,0 +1,75 @@
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+
+# default synthesiser: Google Text-to-speech
+def gtts_synthesiser(text: str, lang: str, voice: str, path: str):
+    # imported here so that gtts is only needed when synthesising
+    from gtts import gTTS
+
+    # voice: the Google Translate host (accent), e.g. "com", "co.uk"
+    gTTS(text=text, lang=lang, tld=voice).save(path)
+
+
+class TTSCache:
+    """
+    Hold synthesised voice clips in a cache directory, named by a hash of
+    (text, language, voice), so that a text is only synthesised once.
+    Missing clips are synthesised concurrently by a bounded worker pool.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = "Assets/tts_cache",
+        synthesiser: Callable[[str, str, str, str], None] = gtts_synthesiser,
+        max_workers: int = 4,
+    ):
+        self.cache_dir = cache_dir
+        # synthesiser(text, lang, voice, path) writes an mp3 clip to path
+        self.synthesiser = synthesiser
+        self.max_workers = max_workers
+        os.makedirs(cache_dir, exist_ok=True)
+
+    # get the path of the cached clip of text (it may not exist yet)
+    def get_path(self, text: str, lang: str = "en", voice: str = "com"):
+        key = hashlib.sha256(
+            "\0".join((text, lang, voice)).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.mp3")
+
+    # get the paths of the clips of all texts, synthesising missing clips
+    def get_clips(
+        self, texts: list[str], lang: str = "en", voice: str = "com"
+    ) -> list[str]:
+        paths = [self.get_path(text, lang, voice) for text in texts]
+        # each missing text is synthesised once, even if repeated
+        missing = {
+            path: text
+            for text, path in zip(texts, paths)
+            if not os.path.exists(path)
+        }
+        if missing:
+            workers = min(self.max_workers, len(missing))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(self._synthesise, text, lang, voice, path)
+                    for path, text in missing.items()
+                ]
+                # raise the first error, if any
+                for future in futures:
+                    future.result()
+        return paths
+
+    # helper function: synthesise a clip, written to a temporary file
+    # first so that a half-written clip is never taken as cached
+    def _synthesise(self, text: str, lang: str, voice: str, path: str):
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            self.synthesiser(text, lang, voice, temp_path)
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
@@ -0,0 +1,207 @@
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pygame
+
+
+class SoundBank:
+    """
+    Hold every sound of the game, decoded once at startup, and play them on
+    reserved channels so that overlapping sounds never steal each other's
+    channel or decode MP3 on the event thread.
+    Voice lines (the files of each new question set) and the music are
+    decoded on a background thread; a sound played before it is ready
+    starts in update() once it is, instead of stalling the frame.
+    """
+
+    # sound effects and their volume
+    EFFECTS = {
+        "correct": ("Assets/correct.mp3", 0.25),
+        "incorrect": ("Assets/incorrect.mp3", 0.25),
+        "cymbal": ("Assets/cymbal.mp3", 1.0),
+    }
+    # the bot reading the question of each round (of the questions.json
+    # questions, until a new set gives the files of its own)
+    VOICE_LINE_PATH = "Assets/Q{}.mp3"
+    NUM_VOICE_LINES = 3
+    MUSIC_PATH = "Assets/background.mp3"
+    # channel 0 is kept for the voice line, the others for sound effects
+    NUM_CHANNELS = 16
+    NUM_EFFECT_CHANNELS = 6
+
+    _effects: dict[str, pygame.mixer.Sound] = {}
+    # file of the voice line of each round, from round 1
+    _voice_line_paths: list[str] = list(
+        map(VOICE_LINE_PATH.format, range(1, NUM_VOICE_LINES + 1))
+    )
+    # voice line n: (stamp of its file, future of the decoded sound)
+    _voice_lines: dict[int, tuple[tuple, Future]] = {}
+    _music: Future | None = None  # future of the loaded music
+    # sounds to start as soon as they are decoded
+    _waiting_voice_line: int | None = None
+    _waiting_music = False
+    _decoder: ThreadPoolExecutor | None = None
+    _voice_channel = None
+    _effect_channels: list = []
+    _next_effect_channel = 0
+
+    # decode all the sounds and reserve the channels
+    @classmethod
+    def preload(cls):
+        if not cls.is_available():
+            return
+        pygame.mixer.set_num_channels(cls.NUM_CHANNELS)
+        pygame.mixer.set_reserved(1 + cls.NUM_EFFECT_CHANNELS)
+        cls._voice_channel = pygame.mixer.Channel(0)
+        cls._effect_channels = [
+            pygame.mixer.Channel(i)
+            for i in range(1, 1 + cls.NUM_EFFECT_CHANNELS)
+        ]
+        for name, (path, volume) in cls.EFFECTS.items():
+            sound = pygame.mixer.Sound(path)
+            sound.set_volume(volume)
+            cls._effects[name] = sound
+        # the music is loaded once, and only rewound for each round
+        cls._music = cls._get_decoder().submit(cls._load_music)
+        cls.load_voice_lines()
+
+    # (re)decode the voice lines in background, e.g. after new questions
+    # are generated (only the files that changed)
+    # paths: the files of the voice lines from round 1, if they changed
+    @classmethod
+    def load_voice_lines(cls, paths: list[str] | None = None):
+        if paths is not None:
+            cls._voice_line_paths = list(paths)
+        for n in range(1, cls.NUM_VOICE_LINES + 1):
+            cls.prepare_voice_line(n)
+
+    # decode the voice line of round n in background, if its file changed
+    # since it was decoded (call before the round, e.g. at the end of the
+    # previous one)
+    @classmethod
+    def prepare_voice_line(cls, n: int):
+        if not cls.is_available():
+            return
+        stamp = None
+        if n <= len(cls._voice_line_paths):
+            path = cls._voice_line_paths[n - 1]
+            stamp = cls._get_stamp(path)
+        if stamp is None:
+            cls._voice_lines.pop(n, None)
+        elif n not in cls._voice_lines or cls._voice_lines[n][0] != stamp:
+            future = cls._get_decoder().submit(cls._decode, path)
+            cls._voice_lines[n] = (stamp, future)
+
+    # start the sounds that were waiting to be decoded (call every frame)
+    @classmethod
+    def update(cls):
+        if cls._waiting_voice_line is not None:
+            entry = cls._voice_lines.get(cls._waiting_voice_line)
+            if entry is None:
+                cls._waiting_voice_line = None
+            elif entry[1].done():
+                cls._waiting_voice_line = None
+                sound = entry[1].result()
+                if sound is not None:
+                    cls._voice_channel.play(sound)
+        if cls._waiting_music and cls._music.done():
+            cls._waiting_music = False
+            if cls._music.result():
+                pygame.mixer.music.play(loops=-1)
+
+    # play a sound effect on a free effect channel
+    @classmethod
+    def play_effect(cls, name: str):
+        sound = cls._effects.get(name)
+        if sound is None:
+            return
+        channel = cls._get_effect_channel()
+        channel.play(sound)
+
+    # play the voice line of round n (stops the previous one)
+    # (now if it is decoded, else as soon as it is)
+    @classmethod
+    def play_voice_line(cls, n: int):
+        if cls._voice_channel is None:
+            return
+        cls.prepare_voice_line(n)
+        cls._waiting_voice_line = n
+        cls.update()
+
+    # play the background music in loop, from the start
+    @classmethod
+    def play_music(cls):
+        if cls._music is None:
+            return
+        cls._waiting_music = True
+        cls.update()
+
+    # stop the background music (at the end of a round: a voice line still
+    # being decoded is not played either)
+    @classmethod
+    def stop_music(cls):
+        cls._waiting_music = False
+        cls._waiting_voice_line = None
+        if not cls.is_available():
+            return
+        pygame.mixer.music.stop()
+
+    # check if the mixer is working
+    @staticmethod
+    def is_available() -> bool:
+        return pygame.mixer.get_init() is not None
+
+    # helper function: the thread decoding the sounds (pygame releases the
+    # GIL while decoding, so the frames go on meanwhile)
+    @classmethod
+    def _get_decoder(cls) -> ThreadPoolExecutor:
+        if cls._decoder is None:
+            cls._decoder = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="SoundBank"
+            )
+        return cls._decoder
+
+    # helper function: decode a sound (run on the decoding thread)
+    # (None if failed)
+    @staticmethod
+    def _decode(path: str) -> pygame.mixer.Sound | None:
+        try:
+            return pygame.mixer.Sound(path)
+        except (pygame.error, OSError) as e:
+            print(f"Cannot load {path} ({e})")
+            return None
+
+    # helper function: load the music (run on the decoding thread)
+    # (False if failed)
+    @classmethod
+    def _load_music(cls) -> bool:
+        try:
+            pygame.mixer.music.load(cls.MUSIC_PATH)
+        except (pygame.error, OSError) as e:
+            print(f"Cannot load {cls.MUSIC_PATH} ({e})")
+            return False
+        return True
+
+    # helper function: identify the content of a file, to notice when it
+    # is replaced (None if missing)
+    @staticmethod
+    def _get_stamp(path: str) -> tuple | None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    # helper function: pick an idle effect channel,
+    # or the least recently used one if all of them are busy
+    @classmethod
+    def _get_effect_channel(cls) -> pygame.mixer.Channel:
+        num = len(cls._effect_channels)
+        for i in range(num):
+            index = (cls._next_effect_channel + i) % num
+            if not cls._effect_channels[index].get_busy():
+                break
+        else:
+            index = cls._next_effect_channel
+        cls._next_effect_channel = (index + 1) % num
+        return cls._effect_channels[index]
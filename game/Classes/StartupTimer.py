@@ -0,0 +1,31 @@
+import time
+
+
+class StartupTimer:
+    """
+    Measure how long each step of the startup takes, from the creation of
+    the timer (at the top of main.py, so that the imports are included)
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.steps: dict[str, float] = {}  # seconds of each step
+
+    # call at the end of each step
+    def mark(self, step: str):
+        now = time.perf_counter()
+        self.steps[step] = now - self.last
+        self.last = now
+
+    # get the seconds since the start
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+    # get the steps in milliseconds, in one line
+    def report(self) -> str:
+        steps = ", ".join(
+            f"{step} {seconds * 1000:.0f} ms"
+            for step, seconds in self.steps.items()
+        )
+        return f"Startup: {steps} (total {self.elapsed() * 1000:.0f} ms)"
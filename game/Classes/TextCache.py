@@ -0,0 +1,80 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCache:
+    """
+    Hold rendered text surfaces and wrapped text layouts, so that labels
+    which do not change between frames are only rendered once
+    """
+
+    # maximum number of rendered surfaces / layouts kept in memory
+    MAX_SURFACES = 256
+    MAX_LAYOUTS = 64
+
+    # rendered surfaces, keyed by (font, text, color, antialias)
+    _surfaces: OrderedDict = OrderedDict()
+    # wrapped lines, keyed by (font, text, max_width)
+    _layouts: OrderedDict = OrderedDict()
+    # counters, for checking how useful the cache is
+    hits = 0
+    misses = 0
+
+    # get the rendered surface of text (do not modify the returned surface)
+    @classmethod
+    def render(
+        cls,
+        font: pygame.font.Font,
+        text: str,
+        color: tuple,
+        antialias: bool = True,
+    ) -> pygame.Surface:
+        key = (font, text, tuple(color), antialias)
+        surface = cls._surfaces.get(key)
+        if surface is not None:
+            cls.hits += 1
+            cls._surfaces.move_to_end(key)  # mark as recently used
+            return surface
+        cls.misses += 1
+        surface = font.render(text, antialias, color)
+        cls._surfaces[key] = surface
+        # evict the least recently used surface
+        if len(cls._surfaces) > cls.MAX_SURFACES:
+            cls._surfaces.popitem(last=False)
+        return surface
+
+    # split text into lines that fit within max_width pixels
+    @classmethod
+    def wrap(
+        cls, font: pygame.font.Font, text: str, max_width: int
+    ) -> list[str]:
+        key = (font, text, max_width)
+        lines = cls._layouts.get(key)
+        if lines is not None:
+            cls._layouts.move_to_end(key)
+            return lines
+        lines = []
+        current = ""
+        for word in text.split():
+            candidate = f"{current} {word}" if current else word
+            # font.size() measures the text without rendering it
+            if current and font.size(candidate)[0] > max_width:
+                lines.append(current)
+                current = word
+            else:
+                current = candidate
+        if current:
+            lines.append(current)
+        cls._layouts[key] = lines
+        if len(cls._layouts) > cls.MAX_LAYOUTS:
+            cls._layouts.popitem(last=False)
+        return lines
+
+    # drop every cached surface and layout
+    @classmethod
+    def clear(cls):
+        cls._surfaces.clear()
+        cls._layouts.clear()
+        cls.hits = 0
+        cls.misses = 0
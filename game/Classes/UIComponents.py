@@ -4,7 +4,10 @@ from Classes.Constant import Constant
 
 class InputBox:
     """
-    Hold the input box, for player to input text
+    Hold the input box, for player to input text.
+    The text is drawn one character at a time on a growing surface, from
+    glyphs rendered once each, so that typing or deleting a character only
+    blits glyphs instead of rendering the whole text again.
     """
 
     def __init__(self, x, y, width, height, font, text=""):
@@ -15,10 +18,25 @@ class InputBox:
         self.color_inactive = Constant.LIGHT_BLUE
         self.color_active = Constant.BLUE
         self.color = self.color_inactive  # default color is inactive color
-        self.text = text
+        self.text = ""
         self.font = font
         # the inputted text is displayed on the input box
-        self.txt_surface = self.font.render(text, True, self.color)
+        # (glyphs drawn on txt_surface, its first text_width pixels are
+        # shown, its first clean_width pixels have no deleted glyph;
+        # char_xs: where each character of the text starts,
+        # prefix_widths: width of the text without its last characters)
+        self.glyphs: dict[str, tuple[pygame.Surface, int]] = {}
+        self.txt_surface = pygame.Surface(
+            (max(width, 1), self.font.get_height()), pygame.SRCALPHA
+        )
+        self.text_width = 0
+        self.clean_width = 0
+        self.char_xs: list[int] = []
+        self.prefix_widths: list[int] = []
+        self._append(text)
+        # held backspace: seconds until the next character is deleted
+        self.backspace_held = False
+        self.backspace_timer = 0.0
         # a cursor is also added to indicate the input box is active
         # [ just my OCD Σ(ﾟωﾟ) ]
         self.cursor_visible = True
@@ -56,36 +74,42 @@ class InputBox:
                 # if player hitted backspace
                 elif event.key == pygame.K_BACKSPACE:
                     # delete the last character in the string
-                    self.text = self.text[:-1]
+                    self._delete_last()
+                    # repeat while held
+                    self.backspace_held = True
+                    self.backspace_timer = Constant.KEY_REPEAT_DELAY
 
                 else:
                     # if player is not hitting some command keybinds,
                     # but characters that can be printed
                     if event.unicode.isprintable():
-                        self.text += event.unicode
+                        self._append(event.unicode)
 
-                # render the inputted text
-                self.txt_surface = self.font.render(
-                    self.text, True, Constant.WHITE
-                )
                 # reset cursor timer
                 self.cursor_timer = 0
+        if event.type == pygame.KEYUP and event.key == pygame.K_BACKSPACE:
+            self.backspace_held = False
 
         return returned_enter  # return (if enter is pressed)
 
-    # deal with backspacing answer if exists
-    def handle_hold_backspace(self):
-        if self.active:
-            if len(self.text) >= 1:
-                self.text = self.text[:-1]  # delete last character
-        # render text
-        self.txt_surface = self.font.render(self.text, True, Constant.WHITE)
-        # reset cursor
-        self.cursor_timer = 0
-        self.cursor_visible = True
-
     # update the cursor in the input box (to achieve blinking cursor)
+    # and repeat the held backspace
     def update(self, dt):
+        # the key may be released while the events went elsewhere
+        if self.backspace_held and (
+            not self.active
+            or not pygame.key.get_pressed()[pygame.K_BACKSPACE]
+        ):
+            self.backspace_held = False
+        # delete a character every KEY_REPEAT_INTERVAL seconds (in time,
+        # so at the same speed whatever the frame rate)
+        if self.backspace_held:
+            self.backspace_timer -= dt
+            while self.backspace_timer <= 0 and self.text:
+                self.backspace_timer += Constant.KEY_REPEAT_INTERVAL
+                self._delete_last()
+                self.cursor_timer = 0
+                self.cursor_visible = True
         # if the input box is activated
         if self.active:
             self.cursor_timer += dt
@@ -101,8 +125,84 @@ class InputBox:
     # clear string in the input box
     def clear(self):
         self.text = ""
-        # render the empty string
-        self.txt_surface = self.font.render(self.text, True, Constant.WHITE)
+        # (the glyphs drawn are overwritten by the next ones)
+        self.text_width = 0
+        self.clean_width = 0
+        self.char_xs = []
+        self.prefix_widths = []
+        self.backspace_held = False
+
+    # helper function: add characters to the text, drawing their glyphs
+    # after the shown part of the surface
+    def _append(self, chars: str):
+        for char in chars:
+            glyph, advance = self._get_glyph(char)
+            # (measured with the text, for the kerning with the previous
+            # character; measuring does not render)
+            end = self.font.size(self.text + char)[0]
+            x = end - advance
+            right = max(x + glyph.get_width(), end)
+            # grow the surface (doubling its width, so rarely; some glyphs
+            # are taller than the font height)
+            width, height = self.txt_surface.get_size()
+            if right > width or glyph.get_height() > height:
+                surface = pygame.Surface(
+                    (
+                        max(right, width * 2),
+                        max(glyph.get_height(), height),
+                    ),
+                    pygame.SRCALPHA,
+                )
+                surface.blit(self.txt_surface, (0, 0))
+                self.txt_surface = surface
+            # clear what deleted characters left there first
+            self._redraw(min(x, self.clean_width), right)
+            # (overlapping glyphs are blended, like when the font renders
+            # the whole text)
+            self.txt_surface.blit(glyph, (x, 0))
+            self.text += char
+            self.char_xs.append(x)
+            self.prefix_widths.append(self.text_width)
+            self.text_width = end
+            self.clean_width = right
+
+    # helper function: the glyph of a character (rendered once) and how
+    # far it moves the next character
+    def _get_glyph(self, char: str) -> tuple[pygame.Surface, int]:
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            surface = self.font.render(char, True, Constant.WHITE)
+            glyph = (surface, self.font.size(char)[0])
+            self.glyphs[char] = glyph
+        return glyph
+
+    # helper function: delete the last character (nothing to render)
+    def _delete_last(self):
+        if self.text:
+            self.text = self.text[:-1]
+            x = self.char_xs.pop()
+            self.text_width = self.prefix_widths.pop()
+            # its glyph stays drawn after the text until characters are
+            # added again (only what overlaps the text is cleared now)
+            if x < self.text_width:
+                self._redraw(x, self.text_width)
+            self.clean_width = min(self.clean_width, max(x, self.text_width))
+
+    # helper function: clear the surface between left and right, and draw
+    # again what the glyphs of the text have there
+    def _redraw(self, left: int, right: int):
+        height = self.txt_surface.get_height()
+        self.txt_surface.fill((0, 0, 0, 0), (left, 0, right - left, height))
+        for i in range(len(self.text) - 1, -1, -1):
+            glyph = self._get_glyph(self.text[i])[0]
+            if self.char_xs[i] + glyph.get_width() <= left:
+                break
+            start = max(left, self.char_xs[i])
+            self.txt_surface.blit(
+                glyph,
+                (start, 0),
+                (start - self.char_xs[i], 0, right - start, height),
+            )
 
     # draw the input box on the screen
     def draw(self, screen: pygame.Surface):
@@ -116,11 +216,15 @@ class InputBox:
             self.rect.y
             + (self.rect.height - self.txt_surface.get_height()) // 2
         )
-        # render text surface
-        screen.blit(self.txt_surface, (self.rect.x + 5, text_y))
+        # render text surface (only the part of the current text)
+        screen.blit(
+            self.txt_surface,
+            (self.rect.x + 5, text_y),
+            (0, 0, self.text_width, self.txt_surface.get_height()),
+        )
         # check if input box is activated
         if self.active and self.cursor_visible:
-            cursor_x = self.rect.x + 5 + self.txt_surface.get_width()
+            cursor_x = self.rect.x + 5 + self.text_width
             # horizontal & vertical position for the cursor
             if cursor_x < self.rect.right - 5:
                 cursor_y_start = text_y
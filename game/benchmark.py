@@ -0,0 +1,232 @@
+"""
+Benchmarks of the hot paths of the game: drawing a frame, updating the
+audience, matching guesses and loading questions.
+They run under the SDL dummy video/audio drivers (no window is opened).
+
+Run in this directory (like main.py):
+    python benchmark.py                 compare with the saved baseline
+    python benchmark.py --save          save the results as the baseline
+    python benchmark.py --threshold 0.3 flag results >30% slower
+Exit code 1 if any result is slower than the baseline beyond the threshold.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import string
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from Classes.Answer import Answer
+from Classes.AssetCache import AssetCache
+from Classes.Audience import Audience
+from Classes.Constant import Constant
+from Classes.Game import Game, UIManager
+from Classes.Player import Player
+from Classes.Question.Question import Question
+
+BASELINE_PATH = "benchmark_baseline.json"
+
+
+# time a function: median time of one call in milliseconds
+def measure(func, repeat: int = 7, number: int = 20) -> float:
+    func()  # warm up (fill caches, like in a running game)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+    return statistics.median(times) * 1000
+
+
+# random question data with num_answers answers
+def make_question_data(num_answers: int) -> dict:
+    return {
+        "question": "Name something people do in Hong Kong on a Sunday.",
+        "answers": [
+            {
+                "text": "".join(
+                    random.choice(string.ascii_uppercase + " ")
+                    for _ in range(random.randint(5, 20))
+                ).strip()
+                or "A",
+                "points": random.randint(1, 30),
+            }
+            for _ in range(num_answers)
+        ],
+    }
+
+
+# a headless game in the middle of round 1, with a display and UI
+# (so that no question generation is started)
+def make_drawable_game(resolution, num_answers, num_popups) -> Game:
+    Constant.SCREEN_WIDTH, Constant.SCREEN_HEIGHT = resolution
+    screen = pygame.display.set_mode(resolution)
+    AssetCache.preload()
+    game = Game(headless=True, question_data=[make_question_data(num_answers)])
+    game.screen = screen
+    game._start_new_game()
+    game.round_time_remaining = 35
+    game.ui_manager = UIManager(game)
+    game.audience = Audience()
+    # half of the answers are guessed
+    for answer in game.get_current_question().answers[::2]:
+        answer.guess()
+        answer.who_guessed = Constant.Player_Name
+    for i in range(num_popups):
+        game.ui_manager.add_guess_popup(f"Incorrect Guess! {i}", Player())
+    return game
+
+
+def bench_draw(results: dict):
+    for resolution in [(1000, 700), (1920, 1080)]:
+        for num_answers in [6, 12]:
+            for num_popups in [0, 20]:
+                game = make_drawable_game(resolution, num_answers, num_popups)
+
+                def draw_frame():
+                    game.ui_manager.draw(game.screen)
+                    game.audience.draw(game.screen)
+
+                key = (
+                    f"ui_draw[{resolution[0]}x{resolution[1]},"
+                    f"answers={num_answers},popups={num_popups}]"
+                )
+                results[key] = measure(draw_frame)
+    Constant.SCREEN_WIDTH, Constant.SCREEN_HEIGHT = 1000, 700
+    pygame.display.set_mode((Constant.SCREEN_WIDTH, Constant.SCREEN_HEIGHT))
+
+
+def bench_audience(results: dict):
+    player = Player(Constant.Player_Name)
+    # an answer worth 1 point (moves 1% of the audience)
+    answer = Answer("X", 1)
+    engines = [("Audience", Audience, [100])]
+    try:
+        from Classes.CrowdAudience import CrowdAudience
+
+        engines.append(
+            ("CrowdAudience", CrowdAudience, [100, 1000, 10000])
+        )
+    except ImportError:
+        print("numpy is not installed, CrowdAudience is skipped")
+    for name, engine, sizes in engines:
+        for size in sizes:
+            if engine is Audience:
+                audience = Audience()
+            else:
+                audience = engine(size, seed=0)
+            audience.reset_positions()
+
+            # keep members walking: send a new group away every frame
+            def update():
+                audience.react_to_answer(answer, player)
+                audience.update(1 / Constant.FPS)
+
+            results[f"audience_update[{name},members={size}]"] = measure(
+                update
+            )
+
+
+def bench_find_answer(results: dict):
+    for num_answers in [6, 50, 200]:
+        question = Question(make_question_data(num_answers))
+        texts = [ans.text for ans in question.answers]
+        # exact, misspelled and wrong guesses
+        guesses = (
+            texts[:10]
+            + [text[:-1] + "Q" for text in texts[:10]]
+            + ["SOMETHING ELSE ENTIRELY"] * 10
+        )
+
+        def find_all():
+            for guess in guesses:
+                question.find_answer(guess, Constant.Player_Name)
+
+        results[f"find_answer[answers={num_answers}]"] = measure(find_all)
+
+
+def bench_load_questions(results: dict):
+    game = Game(headless=True, question_data=[])
+    for num_questions in [3, 100, 1000]:
+        data = [make_question_data(6) for _ in range(num_questions)]
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".json", delete=False
+        ) as f:
+            json.dump(data, f)
+        try:
+            results[f"load_questions[questions={num_questions}]"] = measure(
+                lambda: game._load_questions(f.name), number=5
+            )
+        finally:
+            os.remove(f.name)
+
+
+# compare results with the baseline, return the regressed benchmarks
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    for key, ms in results.items():
+        old = baseline.get(key)
+        if old is None:
+            print(f"{key:60} {ms:9.3f} ms   (new)")
+            continue
+        change = (ms - old) / old
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(key)
+        print(f"{key:60} {ms:9.3f} ms {change:+7.1%}{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--save", action="store_true", help="save results as the baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative slowdown flagged as a regression (default 0.2)",
+    )
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    args = parser.parse_args()
+
+    random.seed(0)
+    pygame.init()
+    pygame.display.set_mode((Constant.SCREEN_WIDTH, Constant.SCREEN_HEIGHT))
+    results = {}
+    bench_draw(results)
+    bench_audience(results)
+    bench_find_answer(results)
+    bench_load_questions(results)
+    pygame.quit()
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=4)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than the baseline")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""
+Calibrate the difficulty presets of the AI player by simulation.
+Whole games of the AI against models of human players are simulated in
+headless mode across a process pool; the AI settings giving the wanted
+win rates of a reference human are saved as presets in
+Classes/ai_presets.json (loaded by AIPlayer.from_preset). The "normal"
+preset is the original AI (the AIPlayer defaults), only measured.
+
+Run in this directory (like main.py):
+    python calibrate.py                    calibrate and save the presets
+    python calibrate.py --games 2000       more games per AI setting
+    python calibrate.py --reference casual calibrate for casual players
+    python calibrate.py --dry-run          print the presets only
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+
+from Classes.Game import AIPlayer, Game
+
+QUESTIONS_PATH = "./Classes/Question/questions.json"
+
+# models of human players:
+# first_guess: seconds before the first guess of a round
+# mean_interval: mean seconds between guesses (exponentially distributed)
+# accuracy: chance that a guess is a correct answer (popular answers,
+#           i.e. with more points, come to mind more often)
+HUMAN_MODELS = {
+    "casual": {"first_guess": 8.0, "mean_interval": 7.0, "accuracy": 0.3},
+    "regular": {"first_guess": 5.0, "mean_interval": 5.0, "accuracy": 0.45},
+    "expert": {"first_guess": 3.0, "mean_interval": 3.5, "accuracy": 0.6},
+}
+
+# win rate of the reference human player aimed at by each difficulty
+# (other than "normal", the original AI)
+TARGET_WIN_RATES = {"easy": 0.6, "hard": 0.1}
+
+# AI settings searched: accuracy x mean delay between guesses
+# (the delay is drawn from mean +-40%, the first guess after the mean)
+ACCURACIES = np.round(np.linspace(0.1, 0.9, 17), 2)
+MEAN_DELAYS = [2.0, 3.0, 4.0, 5.0, 6.0, 8.0, 10.0]
+
+# games simulated by one task of the pool
+GAMES_PER_TASK = 100
+
+
+# settings of the AI player with a mean delay between guesses
+def make_ai_params(accuracy: float, mean_delay: float) -> dict:
+    return {
+        "first_delay": mean_delay,
+        "min_delay": round(mean_delay * 0.6, 2),
+        "max_delay": round(mean_delay * 1.4, 2),
+        "accuracy": float(accuracy),
+    }
+
+
+# the guesses of a human model in each round of a game
+# (in the format of Game.simulate_game)
+def make_human_guesses(
+    game: Game, human: dict, rng: np.random.Generator
+) -> dict[int, list[tuple[float, str]]]:
+    guesses = {}
+    for round_number in range(1, game.max_rounds + 1):
+        question = game.questions[(round_number - 1) % len(game.questions)]
+        points = np.array([ans.points for ans in question.answers], float)
+        # more guesses than can fit in a round, cut at the end of the round
+        num = int(game.round_time_total / human["mean_interval"] * 2) + 2
+        times = human["first_guess"] + np.cumsum(
+            rng.exponential(human["mean_interval"], num)
+        )
+        times = times[times < game.round_time_total]
+        correct = rng.random(len(times)) < human["accuracy"]
+        chosen = rng.choice(len(points), len(times), p=points / points.sum())
+        guesses[round_number] = [
+            (
+                float(t),
+                question.answers[i].text if ok else "SOMETHING WRONG",
+            )
+            for t, ok, i in zip(times, correct, chosen)
+        ]
+    return guesses
+
+
+# simulate games of an AI setting against a human model
+# (run in the worker processes: return the scores, one row per game)
+def simulate_batch(task: tuple) -> np.ndarray:
+    ai_params, human, question_data, num_games, seed, dt = task
+    rng = np.random.default_rng(seed)
+    game = Game(
+        headless=True,
+        question_data=question_data,
+        seed=int(rng.integers(2**63)),
+    )
+    game.ai_player = AIPlayer(**ai_params)
+    scores = np.empty((num_games, 2), dtype=np.int32)
+    for i in range(num_games):
+        scores[i] = game.simulate_game(
+            make_human_guesses(game, human, rng), dt
+        )
+    return scores
+
+
+# simulate num_games games of each (AI setting, human model) pair
+# (return the scores of each pair, one row per game)
+def run_games(
+    pool: Pool,
+    pairs: list[tuple[dict, dict]],
+    question_data: list[dict],
+    num_games: int,
+    seed: int,
+    dt: float,
+) -> list[np.ndarray]:
+    tasks = []
+    owners = []
+    seed_sequence = np.random.SeedSequence(seed)
+    for pair_index, (ai_params, human) in enumerate(pairs):
+        for start in range(0, num_games, GAMES_PER_TASK):
+            count = min(GAMES_PER_TASK, num_games - start)
+            tasks.append(
+                (
+                    ai_params,
+                    human,
+                    question_data,
+                    count,
+                    seed_sequence.spawn(1)[0],
+                    dt,
+                )
+            )
+            owners.append(pair_index)
+    results = [[] for _ in pairs]
+    for owner, scores in zip(owners, pool.imap(simulate_batch, tasks)):
+        results[owner].append(scores)
+    return [np.concatenate(scores) for scores in results]
+
+
+# win rates and score distribution of simulated games
+def summarize(scores: np.ndarray) -> dict:
+    human, ai = scores[:, 0], scores[:, 1]
+    margin = human - ai
+    return {
+        "human_win_rate": round(float(np.mean(margin > 0)), 3),
+        "draw_rate": round(float(np.mean(margin == 0)), 3),
+        "mean_human_score": round(float(human.mean()), 1),
+        "mean_ai_score": round(float(ai.mean()), 1),
+        "margin_p10": round(float(np.percentile(margin, 10)), 1),
+        "margin_p50": round(float(np.percentile(margin, 50)), 1),
+        "margin_p90": round(float(np.percentile(margin, 90)), 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--games", type=int, default=500, help="games per AI setting"
+    )
+    parser.add_argument(
+        "--reference",
+        choices=HUMAN_MODELS,
+        default="regular",
+        help="human model the target win rates refer to",
+    )
+    parser.add_argument("--questions", default=QUESTIONS_PATH)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--dt", type=float, default=0.1, help="simulation timestep"
+    )
+    parser.add_argument("--output", default=AIPlayer.PRESETS_PATH)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="do not save the presets"
+    )
+    args = parser.parse_args()
+
+    with open(args.questions, "r", encoding="utf-8") as f:
+        question_data = json.load(f)
+    reference = HUMAN_MODELS[args.reference]
+    settings = [
+        make_ai_params(accuracy, mean_delay)
+        for accuracy in ACCURACIES
+        for mean_delay in MEAN_DELAYS
+    ]
+
+    start = time.perf_counter()
+    with Pool(args.processes) as pool:
+        # win rate of the reference human against every AI setting
+        win_rates = np.array(
+            [
+                np.mean(scores[:, 0] > scores[:, 1])
+                for scores in run_games(
+                    pool,
+                    [(ai_params, reference) for ai_params in settings],
+                    question_data,
+                    args.games,
+                    args.seed,
+                    args.dt,
+                )
+            ]
+        )
+        # closest setting to each target (win rates within 5% of it are
+        # equally close: then the pace closest to the original AI's, so
+        # that the difficulty mostly comes from the accuracy)
+        normal = AIPlayer()
+        delays = np.array([ai["first_delay"] for ai in settings])
+        presets = {}
+        for difficulty, target in TARGET_WIN_RATES.items():
+            distance = np.floor(np.abs(win_rates - target) / 0.05)
+            order = np.lexsort(
+                (np.abs(delays - normal.first_delay), distance)
+            )
+            presets[difficulty] = dict(settings[order[0]])
+        presets["normal"] = {
+            "first_delay": normal.first_delay,
+            "min_delay": normal.min_delay,
+            "max_delay": normal.max_delay,
+            "accuracy": normal.accuracy,
+        }
+        presets = {
+            difficulty: presets[difficulty]
+            for difficulty in ("easy", "normal", "hard")
+        }
+        # check the presets against every human model
+        pairs = [
+            (presets[difficulty], human)
+            for difficulty in presets
+            for human in HUMAN_MODELS.values()
+        ]
+        results = iter(
+            run_games(
+                pool,
+                pairs,
+                question_data,
+                args.games,
+                args.seed + 1,
+                args.dt,
+            )
+        )
+        for difficulty, preset in presets.items():
+            preset["games"] = args.games
+            preset["results"] = {
+                name: summarize(next(results)) for name in HUMAN_MODELS
+            }
+    elapsed = time.perf_counter() - start
+
+    num_games = args.games * (len(settings) + len(pairs))
+    print(
+        f"{num_games} games simulated in {elapsed:.1f} s"
+        f" ({num_games / elapsed:.0f} games/s)"
+    )
+    for difficulty, preset in presets.items():
+        rates = ", ".join(
+            f"{name} {result['human_win_rate']:.0%}"
+            for name, result in preset["results"].items()
+        )
+        print(
+            f"{difficulty:7} accuracy {preset['accuracy']:.2f},"
+            f" delay {preset['min_delay']}-{preset['max_delay']} s"
+            f" | human win rate: {rates}"
+        )
+    if not args.dry_run:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(presets, f, indent=4)
+        print(f"Presets saved to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,15 @@
-from dotenv import load_dotenv
-import os
+from Classes.StartupTimer import StartupTimer
 
-from Classes.Game import Game
-from Classes.Question.GenerateQuestions import GenerateQuestions
-from Classes.Question.GenerateQuestionAudio import GenerateQuestionAudio
+# time the startup from here, so that importing the game is included
+startup_timer = StartupTimer()
+
+from Classes.Game import Game  # noqa: E402
+
+startup_timer.mark("imports")
 
 
 if __name__ == "__main__":
-    # get chatgpt api key
-    load_dotenv()
-    AZURE_API_KEY = os.getenv("AZURE_API_KEY")
-    # generate questions & answerers with chatGPT
-    GenerateQuestions(AZURE_API_KEY)
-    # generate question audio voice with Google Text-to-speech
-    GenerateQuestionAudio()
-    game = Game()
+    # questions & answers are generated with chatGPT, and question audio
+    # with Google Text-to-speech, in background once the game is opened
+    game = Game(startup_timer=startup_timer)
     game.run()
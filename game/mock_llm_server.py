@@ -0,0 +1,190 @@
+"""
+Local stand-in for the Azure OpenAI chat endpoint, for tests and
+benchmarks of question generation without the network or an API key.
+It answers chat completions (streamed or not) with questions taken from
+a questions.json file, after a configurable latency. It can fail some
+requests to exercise the retries, and break some questions to exercise
+the validation.
+
+Run in this directory (like main.py):
+    python mock_llm_server.py --port 8000 --latency 1.0 --fail-rate 0.2
+    python mock_llm_server.py --invalid-rate 0.3
+then start the game (or a benchmark) with
+    LLM_BASE_URL=http://127.0.0.1:8000 AZURE_API_KEY=mock python main.py
+"""
+
+import argparse
+import json
+import random
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+QUESTIONS_PATH = "./Classes/Question/questions.json"
+
+
+class MockLLMHandler(BaseHTTPRequestHandler):
+    """
+    Answer POST .../chat/completions like the Azure OpenAI endpoint
+    """
+
+    # keep connections alive, like the real endpoint
+    protocol_version = "HTTP/1.1"
+
+    # set by main()
+    questions: list[dict] = []
+    latency = 0.0  # seconds before the first byte of the reply
+    chunk_delay = 0.0  # seconds between streamed chunks
+    chunk_size = 40  # characters per streamed chunk
+    fail_rate = 0.0  # fraction of requests answered with a 503
+    invalid_rate = 0.0  # fraction of questions with an answer missing
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            request = {}
+        if not self.path.split("?")[0].endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "not found"}})
+            return
+        time.sleep(self.latency)
+        if random.random() < self.fail_rate:
+            self._send_json(503, {"error": {"message": "mock failure"}})
+            return
+        content = self._make_content(request)
+        if request.get("stream"):
+            self._send_stream(content)
+        else:
+            self._send_json(
+                200,
+                {
+                    "id": "mock",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": request.get("model", "mock"),
+                    "choices": [
+                        {
+                            "index": 0,
+                            "finish_reason": "stop",
+                            "message": {
+                                "role": "assistant",
+                                "content": content,
+                            },
+                        }
+                    ],
+                },
+            )
+
+    # helper function: the reply of the model, in the format asked by
+    # the prompt (a json array in a ``` block, or a json object in json
+    # mode)
+    def _make_content(self, request: dict) -> str:
+        questions = [
+            (
+                self._break(question)
+                if random.random() < self.invalid_rate
+                else self._rename(question)
+            )
+            for question in random.sample(
+                self.questions, len(self.questions)
+            )
+        ]
+        response_format = request.get("response_format") or {}
+        if response_format.get("type") == "json_object":
+            return json.dumps({"questions": questions})
+        return (
+            "Here are the questions:\n```json\n"
+            + json.dumps(questions, indent=4)
+            + "\n```"
+        )
+
+    # helper function: a question with a distinct text, like a new one
+    @staticmethod
+    def _rename(question: dict) -> dict:
+        number = random.randrange(10**6)
+        return dict(question, question=f"{question['question']} #{number}")
+
+    # helper function: a question with its last answer missing
+    @staticmethod
+    def _break(question: dict) -> dict:
+        return dict(question, answers=question["answers"][:-1])
+
+    # helper function: send a json response
+    def _send_json(self, status: int, body: dict):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    # helper function: send the reply as server-sent events
+    # (with chunked transfer encoding, to keep the connection alive)
+    def _send_stream(self, content: str):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        pieces = [
+            content[i : i + self.chunk_size]
+            for i in range(0, len(content), self.chunk_size)
+        ]
+        for i, piece in enumerate(pieces):
+            chunk = {
+                "id": "mock",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": "mock",
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {"content": piece},
+                        "finish_reason": (
+                            "stop" if i == len(pieces) - 1 else None
+                        ),
+                    }
+                ],
+            }
+            self._write_chunk(f"data: {json.dumps(chunk)}\n\n")
+            time.sleep(self.chunk_delay)
+        self._write_chunk("data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    # helper function: write one chunk of a chunked response
+    def _write_chunk(self, text: str):
+        data = text.encode()
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    # print requests in one short line
+    def log_message(self, format, *args):
+        print(f"{self.address_string()} {format % args}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--questions", default=QUESTIONS_PATH)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--chunk-delay", type=float, default=0.02)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--invalid-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with open(args.questions, "r", encoding="utf-8") as f:
+        MockLLMHandler.questions = json.load(f)
+    MockLLMHandler.latency = args.latency
+    MockLLMHandler.chunk_delay = args.chunk_delay
+    MockLLMHandler.fail_rate = args.fail_rate
+    MockLLMHandler.invalid_rate = args.invalid_rate
+    server = ThreadingHTTPServer((args.host, args.port), MockLLMHandler)
+    print(f"Mock chat endpoint on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Re-run a recorded session (see Constant.RECORD_SESSIONS) through the game
+logic in headless mode, as fast as possible or at the recorded speed.
+The replay records itself again and is compared with the original log,
+so that a change of the game logic that alters a session is detected.
+
+Run in this directory (like main.py):
+    python replay.py session_logs/session_20250101_120000.log
+    python replay.py LOG --realtime      wait for the dt of every frame
+    python replay.py LOG --profile       print the slowest functions
+"""
+
+import argparse
+import cProfile
+import io
+import pstats
+import sys
+import time
+
+from Classes.EventLog import EventLog
+from Classes.Game import Game
+from Classes.Question.Question import Question
+
+
+# re-run the records of a log in a headless game
+# (return the replayed game and the log it recorded)
+def replay(path: str, realtime: bool = False) -> tuple[Game, io.BytesIO]:
+    game = None
+    recorded = io.BytesIO()
+    next_frame = time.perf_counter()
+    for record_type, value in EventLog.read(path):
+        if record_type == EventLog.SEED:
+            game = Game(
+                headless=True,
+                question_data=[],
+                seed=value,
+                event_log=EventLog(recorded),
+            )
+        elif record_type == EventLog.QUESTIONS:
+            game.questions = [Question(q_data) for q_data in value]
+        elif record_type == EventLog.ADD_QUESTIONS:
+            game._add_questions(value)
+        elif record_type == EventLog.START_GAME:
+            game._start_new_game()
+        elif record_type == EventLog.NEXT_ROUND:
+            game._next_round_or_end_game()
+        elif record_type == EventLog.TICK:
+            if realtime:
+                next_frame += value
+                time.sleep(max(0.0, next_frame - time.perf_counter()))
+            game._update(value)
+        elif record_type == EventLog.GUESS:
+            name, text = value
+            # the AI makes the same guesses by itself (same seed)
+            if name != game.ai_player.name:
+                game._check_answer(text, game.player1)
+        elif record_type == EventLog.STATE:
+            # states reached by the game logic are already changed,
+            # the others (e.g. back to the menu) come from the inputs
+            game.change_state(value)
+    if game is None:
+        raise ValueError(f"{path} has no session")
+    return game, recorded
+
+
+# index of the first record that differs between two logs
+# (None if they are identical)
+def find_divergence(original: str, replayed: str) -> int | None:
+    records = list(EventLog.read(original))
+    replayed_records = list(EventLog.read(replayed))
+    for i, (a, b) in enumerate(zip(records, replayed_records)):
+        if a != b:
+            return i
+    if len(records) != len(replayed_records):
+        return min(len(records), len(replayed_records))
+    return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("log", help="event log of a recorded session")
+    parser.add_argument(
+        "--realtime", action="store_true", help="replay at recorded speed"
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="profile the replay"
+    )
+    args = parser.parse_args()
+
+    profiler = cProfile.Profile() if args.profile else None
+    start = time.perf_counter()
+    if profiler:
+        profiler.enable()
+    game, recorded = replay(args.log, args.realtime)
+    if profiler:
+        profiler.disable()
+    elapsed = time.perf_counter() - start
+
+    records = list(EventLog.read(args.log))
+    ticks = [value for kind, value in records if kind == EventLog.TICK]
+    print(f"{len(records)} records, {len(ticks)} frames")
+    print(
+        f"session {sum(ticks):.1f} s, replayed in {elapsed:.3f} s"
+        f" ({sum(ticks) / max(elapsed, 1e-9):.0f}x)"
+    )
+    print(
+        f"scores: {game.player1.name} {game.player1.game_score},"
+        f" {game.ai_player.name} {game.ai_player.game_score}"
+    )
+    if profiler:
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+
+    with open(args.log, "rb") as f:
+        identical = f.read() == recorded.getvalue()
+    if not identical:
+        with open(args.log + ".replay", "wb") as f:
+            f.write(recorded.getvalue())
+        index = find_divergence(args.log, args.log + ".replay")
+        print(f"replay diverged at record {index} (see {args.log}.replay)")
+        return 1
+    print("replay identical to the recorded session")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
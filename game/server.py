@@ -0,0 +1,192 @@
+"""
+Network server hosting many game rooms on one asyncio event loop.
+Clients connect over TCP and exchange one JSON object per line.
+
+Client -> server:
+    {"type": "join", "room": "room1", "name": "Alice"}
+    {"type": "start"}                       start a game in the room
+    {"type": "guess", "text": "egg tart"}
+    {"type": "leave"}
+Server -> client:
+    joined, left, round_start, guess_result, revealed, round_end,
+    game_over, error (see Classes/GameRoom.py)
+
+Run in this directory (like main.py):
+    python server.py --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from Classes.GameRoom import GameRoom
+from Classes.Question.QuestionBank import QuestionBank
+
+
+class GameServer:
+    """
+    Hold all rooms, the connected clients and the shared question bank
+    """
+
+    TICK_RATE = 20  # room updates per second
+    QUESTIONS_PATH = "./Classes/Question/questions.json"
+
+    def __init__(self, question_bank: QuestionBank):
+        self.question_bank = question_bank
+        self.rooms: dict[str, GameRoom] = {}
+        # writers of the clients in each room, by player name
+        self.clients: dict[str, dict[str, asyncio.StreamWriter]] = {}
+
+    # serve until cancelled
+    async def serve(self, host: str, port: int):
+        server = await asyncio.start_server(self.handle_client, host, port)
+        print(f"Serving on {host}:{port}")
+        async with server:
+            await asyncio.gather(server.serve_forever(), self.tick_rooms())
+
+    # update every room at a fixed rate
+    async def tick_rooms(self):
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(1 / self.TICK_RATE)
+            now = time.perf_counter()
+            dt = now - last
+            last = now
+            for room_id, room in list(self.rooms.items()):
+                self.broadcast(room_id, room.tick(dt))
+
+    # handle the messages of one client
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        room_id = None
+        name = None
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError) as e:
+                    # a line longer than the limit of the stream: drop the
+                    # client
+                    print(f"Dropping client {name!r}: {e}")
+                    break
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                    msg_type = message["type"]
+                except (ValueError, KeyError, TypeError):
+                    self.send(writer, [self._error("invalid message")])
+                    continue
+                if msg_type == "join" and room_id is None:
+                    room_id, name = self.join(message, writer)
+                elif room_id is None:
+                    self.send(writer, [self._error("join a room first")])
+                elif msg_type == "start":
+                    self.reply(room_id, writer, self.rooms[room_id].start())
+                elif msg_type == "guess":
+                    events = self.rooms[room_id].guess(
+                        name, str(message.get("text", ""))
+                    )
+                    self.reply(room_id, writer, events)
+                elif msg_type == "leave":
+                    break
+                else:
+                    self.send(writer, [self._error("unknown message type")])
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if room_id is not None:
+                self.leave(room_id, name)
+            writer.close()
+
+    # add a client to a room (the room is created if it does not exist)
+    # (return the room id and player name, None if failed)
+    def join(self, message: dict, writer: asyncio.StreamWriter):
+        room_id = str(message.get("room", ""))
+        name = str(message.get("name", ""))
+        room = self.rooms.get(room_id)
+        if (
+            not room_id
+            or not name
+            or name == "AI"
+            or name in self.clients.get(room_id, {})
+        ):
+            self.send(writer, [self._error("invalid room or name")])
+            return None, None
+        if room is None:
+            room = GameRoom(room_id, self._get_question_data())
+            self.rooms[room_id] = room
+            self.clients[room_id] = {}
+        self.clients[room_id][name] = writer
+        self.broadcast(room_id, room.join(name))
+        return room_id, name
+
+    # remove a client from its room (the room is closed if empty)
+    def leave(self, room_id: str, name: str):
+        room = self.rooms[room_id]
+        self.clients[room_id].pop(name, None)
+        self.broadcast(room_id, room.leave(name))
+        if room.is_empty():
+            del self.rooms[room_id]
+            del self.clients[room_id]
+
+    # send events to every client in a room
+    def broadcast(self, room_id: str, events: list[dict]):
+        if not events:
+            return
+        data = self._encode(events)
+        for writer in self.clients.get(room_id, {}).values():
+            if not writer.is_closing():
+                writer.write(data)
+
+    # send the events caused by a client's message:
+    # errors to the client only, other events to the whole room
+    def reply(
+        self,
+        room_id: str,
+        writer: asyncio.StreamWriter,
+        events: list[dict],
+    ):
+        errors = [event for event in events if event["type"] == "error"]
+        if errors:
+            self.send(writer, errors)
+        self.broadcast(
+            room_id, [event for event in events if event["type"] != "error"]
+        )
+
+    # send events to one client
+    def send(self, writer: asyncio.StreamWriter, events: list[dict]):
+        writer.write(self._encode(events))
+
+    # helper function: questions of a new room, from the shared bank
+    # (the questions.json if the bank does not have enough questions)
+    def _get_question_data(self) -> list[dict]:
+        questions = self.question_bank.sample(3)
+        if len(questions) < 3:
+            with open(self.QUESTIONS_PATH, "r", encoding="utf-8") as f:
+                questions = json.load(f)
+        return questions
+
+    # helper function: one json object per line
+    @staticmethod
+    def _encode(events: list[dict]) -> bytes:
+        return "".join(json.dumps(event) + "\n" for event in events).encode()
+
+    # helper function: error event
+    @staticmethod
+    def _error(message: str) -> dict:
+        return {"type": "error", "message": message}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Guess Their Answer server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    try:
+        asyncio.run(GameServer(QuestionBank()).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass